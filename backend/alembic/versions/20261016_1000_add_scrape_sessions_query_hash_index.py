@@ -0,0 +1,38 @@
+"""Add index on scrape_sessions.query_hash
+
+Revision ID: 20261016_1000
+Revises: 20260125_1815
+Create Date: 2026-10-16 10:00:00
+
+The query_normalized backfill looks up scrape_sessions rows by
+query_hash. Without an index every batch has to scan scrape_sessions.
+
+Built CONCURRENTLY so scrape_sessions stays writable during the build;
+that cannot run inside a transaction, hence the autocommit block.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_1000'
+down_revision = '20260125_1815'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add index for query_hash joins/lookups."""
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_scrape_sessions_query_hash
+            ON scrape_sessions(query_hash);
+        """)
+
+    print("✅ Created index idx_scrape_sessions_query_hash on scrape_sessions")
+
+
+def downgrade():
+    """Remove the index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_scrape_sessions_query_hash;")
+    print("🔻 Dropped index idx_scrape_sessions_query_hash from scrape_sessions")
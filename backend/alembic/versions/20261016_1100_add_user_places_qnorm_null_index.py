@@ -0,0 +1,46 @@
+"""Add partial index on user_places rows missing query_normalized
+
+Revision ID: 20261016_1100
+Revises: 20261016_1000
+Create Date: 2026-10-16 11:00:00
+
+The query_normalized backfill walks user_places by id in keyset batches:
+
+    WHERE query_normalized IS NULL AND query_hash IS NOT NULL
+      AND id > :last_id ORDER BY id LIMIT :batch_size
+
+A partial index on id covering just the NULL rows lets each batch start
+at `id > :last_id` and read rows in id order without re-filtering the
+already backfilled part of the table. The index shrinks as the backfill
+progresses.
+
+Built CONCURRENTLY so the table stays writable; that cannot run inside a
+transaction, hence the autocommit block.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_1100'
+down_revision = '20261016_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add partial index for the backfill's keyset scan."""
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_places_qnorm_null
+            ON user_places(id)
+            WHERE query_normalized IS NULL;
+        """)
+
+    print("✅ Created partial index idx_user_places_qnorm_null on user_places")
+
+
+def downgrade():
+    """Remove the index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_user_places_qnorm_null;")
+    print("🔻 Dropped index idx_user_places_qnorm_null from user_places")
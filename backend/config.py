@@ -30,6 +30,7 @@ class Settings(BaseSettings):
     HEADLESS: bool = True
     BROWSER_TIMEOUT: int = 60000  # 60 seconds
     PAGE_LOAD_TIMEOUT: int = 60000  # 60 seconds
+    SCRAPER_DEBUG_DOM: bool = False  # Dump page HTML/h1s when name extraction fails (slow)
     
     # User Agent Rotation
     USER_AGENTS: list = [
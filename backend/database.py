@@ -22,6 +22,7 @@ engine = create_engine(
     pool_size=10,
     max_overflow=20,
     pool_pre_ping=True,  # Enable connection health checks
+    executemany_mode='values_plus_batch',  # Batch executemany UPDATEs (psycopg2 execute_batch)
 )
 
 # Create session factory
@@ -18,6 +18,8 @@ from routes.auth import router as auth_router
 from routes.integrations import router as integrations_router
 from routes.whatsapp import router as whatsapp_router
 from services.browser_session_pool import browser_pool
+from services.sms_service import get_sms_service
+from services.whatsapp_service import get_whatsapp_service
 from config import settings
 from database import create_tables
 
@@ -62,6 +64,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Browser pool shutdown error: {e}")
     
+    # Close shared outreach HTTP clients (independently, so one failing
+    # does not leave the other open)
+    try:
+        await get_sms_service().close()
+        logger.info("✅ SMS HTTP session closed")
+    except Exception as e:
+        logger.warning(f"⚠️ SMS session shutdown error: {e}")
+    
+    try:
+        await get_whatsapp_service().close()
+        logger.info("✅ WhatsApp HTTP client closed")
+    except Exception as e:
+        logger.warning(f"⚠️ WhatsApp client shutdown error: {e}")
+    
     logger.info("🛑 Scrappy v2.0 Shutting down...")
 
 
@@ -109,6 +109,7 @@ class ScrapeSession(Base):
     
     __table_args__ = (
         Index('idx_session_user_date', 'user_id', 'created_at'),
+        Index('idx_scrape_sessions_query_hash', 'query_hash'),
     )
     
     def __repr__(self):
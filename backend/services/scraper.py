@@ -18,7 +18,8 @@ import random
 import re
 import time
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
 from concurrent.futures import ThreadPoolExecutor
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Playwright
 
@@ -51,6 +52,332 @@ if sys.platform == 'win32':
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the per-card extraction hot path
+_RE_NUM = re.compile(r'([\d,]+)')
+_RE_REVIEW_COUNT = re.compile(r'([\d,]+)\s*review')
+_RE_COORDS = re.compile(r'@(-?\d+\.?\d*),(-?\d+\.?\d*)')
+
+
+def _parse_count_label(aria_label: str) -> Optional[int]:
+    """Parse "1,234 reviews"; regex only when the label doesn't lead with the number"""
+    first = aria_label.split(None, 1)[0] if aria_label else ''
+    try:
+        return int(first.replace(',', '').replace('.', ''))
+    except ValueError:
+        pass
+    count_match = _RE_NUM.search(aria_label)
+    if count_match:
+        return int(count_match.group(1).replace(',', ''))
+    return None
+
+
+@dataclass(slots=True)
+class BusinessInfo:
+    """Fixed-shape result of place-page extraction (no per-instance __dict__)."""
+    name: Optional[str] = None
+    address: Optional[str] = None
+    phone: Optional[str] = None
+    website: Optional[str] = None
+    rating: Optional[float] = None
+    reviews_count: Optional[int] = None
+    category: Optional[str] = None
+    hours: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    is_claimed: bool = False
+    photo_url: Optional[str] = None
+
+
+# Readiness signals. Google Maps keeps long-poll/telemetry connections open, so
+# 'networkidle' nearly always runs to its timeout; wait for real DOM instead.
+PLACE_READY_SELECTOR = 'h1.DUwDvf, div[role="main"] h1'
+# The header renders before the detail rows; any of these means the sidebar is populated
+SIDEBAR_READY_SELECTOR = 'button[data-item-id="address"], div.F7nice, button.DkEaL'
+RESULTS_READY_SELECTOR = 'a[href*="/maps/place/"]'
+
+# Chromium flags: skip services the scraper never uses and image decoding
+# entirely (extraction only needs text and attributes).
+BROWSER_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions',
+    '--disable-gpu',
+    '--disable-software-rasterizer',
+    '--disable-features=Translate,BackForwardCache',
+    '--blink-settings=imagesEnabled=false',
+]
+
+# Marks the end of extraction on the scrape_stream output queue
+_EXTRACTION_DONE = object()
+
+# Pooled card contexts get their cookies cleared after this many extractions
+CONTEXT_COOKIE_RESET_EVERY = 20
+
+# Requests that are irrelevant to text extraction (map tiles, photos, telemetry).
+# Documents, scripts and XHR are kept so the sidebar still populates.
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+BLOCKED_URL_PARTS = ('googletagmanager', 'google-analytics', '/log204', '/gen_204')
+
+
+async def _block_heavy_requests(route, request) -> None:
+    """Route handler that aborts images/fonts/media and analytics beacons"""
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Single-pass extraction script for place pages.
+# Walks the same selector ladders as the Python fallback inside the page context
+# and returns every field in one CDP round-trip instead of ~30 sequential awaits.
+EXTRACT_JS = r"""
+() => {
+    const SELECTORS = {
+        name_aria: [
+            'div[role="main"] h1',
+            'h1[aria-label]',
+            '*[data-item-id*="title"]',
+        ],
+        name: [
+            'h1.DUwDvf.lfPIob',
+            'h1.DUwDvf',
+            'h1.fontHeadlineLarge',
+            'div.lMbq3e h1',
+            "h1[class*='fontHeadline']",
+            "div[role='main'] h1",
+            'h1',
+        ],
+        rating: [
+            "div.F7nice span[aria-hidden='true']",
+            "span.ceNzKf[role='img']",
+            "div.fontBodyMedium span[aria-hidden='true']",
+        ],
+        category: [
+            'button.DkEaL',
+            "button[jsaction*='category']",
+            'span.DkEaL',
+        ],
+    };
+
+    const clean = (v) => (v && v.trim()) ? v.trim() : null;
+    const textOf = (el) => clean(el.innerText) || clean(el.textContent);
+
+    const firstText = (sels) => {
+        for (const s of sels) {
+            const el = document.querySelector(s);
+            if (el) {
+                const t = textOf(el);
+                if (t) return t;
+            }
+        }
+        return null;
+    };
+
+    const labelled = (sel, marker, limit) => {
+        const els = document.querySelectorAll(sel);
+        for (let i = 0; i < els.length && i < limit; i++) {
+            const a = els[i].getAttribute('aria-label');
+            if (a && a.includes(marker)) return clean(a.replace(marker, ''));
+        }
+        return null;
+    };
+
+    const info = {
+        name: null, address: null, phone: null, website: null,
+        rating: null, reviews_count: null, category: null, hours: null,
+        latitude: null, longitude: null, is_claimed: false, photo_url: null,
+    };
+
+    // Name: aria-label/text on header elements, then CSS ladder, then page title
+    for (const s of SELECTORS.name_aria) {
+        const el = document.querySelector(s);
+        if (!el) continue;
+        const v = clean(el.getAttribute('aria-label')) || clean(el.innerText);
+        if (v) { info.name = v; break; }
+    }
+    if (!info.name) info.name = firstText(SELECTORS.name);
+    if (!info.name && document.title && document.title.includes(' - Google Maps')) {
+        info.name = clean(document.title.replace(' - Google Maps', ''));
+    }
+
+    // Rating: aria-label "4.5 stars", then visible rating text
+    const stars = document.querySelectorAll('*[aria-label*="star"]');
+    for (let i = 0; i < stars.length && i < 5; i++) {
+        const m = (stars[i].getAttribute('aria-label') || '').match(/([\d.,]+)\s*star/i);
+        if (m) {
+            const r = parseFloat(m[1].replace(',', '.'));
+            if (!isNaN(r)) { info.rating = r; break; }
+        }
+    }
+    if (!info.rating) {
+        for (const s of SELECTORS.rating) {
+            const el = document.querySelector(s);
+            if (!el) continue;
+            const t = (el.innerText || '').trim().replace(',', '.');
+            if (t && /^\d/.test(t)) {
+                const r = parseFloat(t);
+                if (!isNaN(r)) { info.rating = r; break; }
+            }
+        }
+    }
+
+    // Reviews count
+    const reviewsBtn = document.querySelector("div.F7nice button[aria-label*='reviews']");
+    if (reviewsBtn) {
+        const m = (reviewsBtn.getAttribute('aria-label') || '').match(/([\d,]+)/);
+        if (m) info.reviews_count = parseInt(m[1].replace(/,/g, ''), 10);
+    }
+    if (!info.reviews_count) {
+        const el = document.querySelector('button[aria-label*="review"]')
+            || document.querySelector('span[aria-label*="review"]');
+        const m = el && (el.textContent || '').match(/([\d,]+)\s*review/);
+        if (m) info.reviews_count = parseInt(m[1].replace(/,/g, ''), 10);
+    }
+
+    info.category = firstText(SELECTORS.category);
+
+    // Address / phone: aria-label marker, data-item-id button, then button text
+    info.address = labelled('*[aria-label*="Address"]', 'Address:', 3);
+    if (!info.address) {
+        const el = document.querySelector('button[data-item-id="address"]');
+        if (el) info.address = clean((el.getAttribute('aria-label') || '').replace('Address:', ''));
+    }
+    if (!info.address) {
+        const el = document.querySelector('button[aria-label*="Address"]');
+        if (el) info.address = clean((el.textContent || '').replace('Address:', ''));
+    }
+
+    info.phone = labelled('*[aria-label*="Phone"]', 'Phone:', 3);
+    if (!info.phone) {
+        const el = document.querySelector('button[data-item-id*="phone"]');
+        if (el) info.phone = clean((el.getAttribute('aria-label') || '').replace('Phone:', ''));
+    }
+    if (!info.phone) {
+        const el = document.querySelector('button[aria-label*="Phone"]');
+        if (el) info.phone = clean((el.textContent || '').replace('Phone:', ''));
+    }
+
+    const website = document.querySelector('a[data-item-id="authority"]');
+    if (website) info.website = website.getAttribute('href');
+
+    const hours = document.querySelector('div[aria-label*="hour"]');
+    if (hours) info.hours = clean(hours.getAttribute('aria-label'));
+
+    // Claimed badge: targeted aria-label first, then a plain span text scan
+    info.is_claimed = !!document.querySelector('span[aria-label*="Claimed"]')
+        || Array.from(document.querySelectorAll('span'))
+            .some((s) => (s.textContent || '').includes('Claimed'));
+
+    const coords = window.location.href.match(/@(-?\d+\.?\d*),(-?\d+\.?\d*)/);
+    if (coords) {
+        info.latitude = parseFloat(coords[1]);
+        info.longitude = parseFloat(coords[2]);
+    }
+
+    const img = document.querySelector('img[decoding="async"]');
+    if (img) info.photo_url = img.getAttribute('src');
+
+    return info;
+}
+"""
+
+# Installs EXTRACT_JS on every document of a context (see _create_context) so
+# per-card extraction only sends a short call instead of the full script.
+EXTRACT_INIT_SCRIPT = f"window.__scrappyExtract = {EXTRACT_JS.strip()};"
+CALL_EXTRACT_JS = "() => window.__scrappyExtract ? window.__scrappyExtract() : null"
+
+# Reads the requested attributes from the first element matching any of the
+# selectors. 'innerText'/'textContent' read the DOM property, anything else is
+# read with getAttribute. Returns null when no element has a non-empty value.
+BATCH_READ_JS = """
+([selectors, attrs]) => {
+    for (const s of selectors) {
+        const el = document.querySelector(s);
+        if (!el) continue;
+        const out = {};
+        let found = false;
+        for (const a of attrs) {
+            const v = (a === 'innerText' || a === 'textContent') ? el[a] : el.getAttribute(a);
+            out[a] = (v && v.trim()) ? v.trim() : null;
+            if (out[a]) found = true;
+        }
+        if (found) return out;
+    }
+    return null;
+}
+"""
+
+# Business name ladder: aria-label-bearing header elements first (most reliable
+# in 2026), then the CSS class ladder. NAME_JS returns the first non-empty
+# aria-label or text, falling back to the page title.
+NAME_ARIA_SELECTORS = [
+    'div[role="main"] h1',           # Main content h1
+    'h1[aria-label]',                 # H1 with aria-label
+    '*[data-item-id*="title"]',      # Data attribute approach
+]
+NAME_SELECTORS = [
+    "h1.DUwDvf.lfPIob",          # Primary selector (2026)
+    "h1.DUwDvf",                  # Simplified primary
+    "h1.fontHeadlineLarge",       # Fallback 1
+    "div.lMbq3e h1",              # Fallback 2
+    "h1[class*='fontHeadline']",  # Pattern match
+    "div[role='main'] h1",        # Role-based
+    "h1",                         # Last resort
+]
+
+NAME_JS = """
+(sels) => {
+    for (const s of sels) {
+        const e = document.querySelector(s);
+        if (e) {
+            const a = e.getAttribute('aria-label');
+            if (a && a.trim()) return a.trim();
+            const t = e.innerText;
+            if (t && t.trim()) return t.trim();
+        }
+    }
+    const title = document.title;
+    if (title && title.includes(' - Google Maps')) {
+        return title.replace(' - Google Maps', '').trim() || null;
+    }
+    return null;
+}
+"""
+
+# Same claimed-badge check as EXTRACT_JS, for the fallback path. Avoids the
+# Playwright ':has-text' custom selector engine.
+IS_CLAIMED_JS = """
+() => !!document.querySelector('span[aria-label*="Claimed"]')
+    || Array.from(document.querySelectorAll('span'))
+        .some((s) => (s.textContent || '').includes('Claimed'))
+"""
+
+# Element-list filters for page.eval_on_selector_all: scan matches inside the
+# page and return only the first useful aria-label (no per-element handles).
+FIRST_STAR_RATING_JS = r"""
+(els) => {
+    for (const e of els) {
+        const a = e.getAttribute('aria-label');
+        const m = a && a.match(/([\d.,]+)\s*star/i);
+        if (m) return m[1];
+    }
+    return null;
+}
+"""
+
+FIRST_LABEL_WITH_MARKER_JS = """
+(els, marker) => {
+    for (const e of els) {
+        const a = e.getAttribute('aria-label');
+        if (a && a.includes(marker)) return a;
+    }
+    return null;
+}
+"""
+
 
 class GoogleMapsScraper:
     """
@@ -59,7 +386,8 @@ class GoogleMapsScraper:
     
     Architecture:
     - Uses asyncio + Semaphore for lightweight concurrency
-    - Each card extraction runs in separate browser context
+    - Card extractions run on a pool of reusable browser contexts
+      (one per concurrent card), opening a fresh page per card
     - Deduplication by Place ID (primary) and CID (secondary)
     - Optional progress tracking for async scrapes
     
@@ -79,9 +407,18 @@ class GoogleMapsScraper:
         """
         self.max_concurrent_cards = max_concurrent_cards or settings.MAX_CONCURRENT_CARDS
         self.dedup_service = PlaceIDDeduplicationService()
+        
+        # Dump DOM diagnostics on failed name extraction (serializes the page body)
+        self._debug_dom = settings.SCRAPER_DEBUG_DOM
+        
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         
+        # Reusable contexts for card extraction (created in start())
+        self._context_pool: Optional[asyncio.Queue] = None
+        self._pooled_contexts: List[BrowserContext] = []
+        self._context_uses: Dict[int, int] = {}
+        
         # Store search query for click-based extraction in parallel contexts
         self._current_search_query: Optional[str] = None
         self._current_search_url: Optional[str] = None
@@ -122,19 +459,31 @@ class GoogleMapsScraper:
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(
             headless=settings.HEADLESS,
-            args=[
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-extensions',
-                '--disable-gpu',
-                '--disable-software-rasterizer',
-            ]
+            args=BROWSER_LAUNCH_ARGS
         )
         logger.info("Browser started successfully")
+        
+        # Pre-create one context per concurrent card so extraction never pays
+        # context startup; cards only open/close pages on them.
+        self._context_pool = asyncio.Queue()
+        self._pooled_contexts = []
+        self._context_uses = {}
+        for _ in range(self.max_concurrent_cards):
+            context = await self._create_context()
+            self._pooled_contexts.append(context)
+            self._context_pool.put_nowait(context)
+        logger.info(f"Context pool ready ({self.max_concurrent_cards} contexts)")
     
     async def close(self) -> None:
-        """Close browser and Playwright"""
+        """Close pooled contexts, browser and Playwright"""
+        for context in self._pooled_contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled context: {e}")
+        self._pooled_contexts = []
+        self._context_pool = None
+        
         if self.browser:
             await self.browser.close()
             logger.info("Browser closed")
@@ -193,8 +542,25 @@ class GoogleMapsScraper:
             locale='en-US',
             timezone_id='America/New_York',
         )
+        await context.route('**/*', _block_heavy_requests)
+        await context.add_init_script(EXTRACT_INIT_SCRIPT)
         return context
     
+    async def _acquire_context(self) -> BrowserContext:
+        """Take a context from the pool (waits if all are busy)"""
+        return await self._context_pool.get()
+    
+    async def _release_context(self, context: BrowserContext) -> None:
+        """Return a context to the pool, clearing cookies periodically to avoid state bleed"""
+        key = id(context)
+        self._context_uses[key] = self._context_uses.get(key, 0) + 1
+        if self._context_uses[key] % CONTEXT_COOKIE_RESET_EVERY == 0:
+            try:
+                await context.clear_cookies()
+            except Exception as e:
+                logger.debug(f"Failed to clear context cookies: {e}")
+        self._context_pool.put_nowait(context)
+    
     async def scrape(
         self,
         query: str,
@@ -216,17 +582,53 @@ class GoogleMapsScraper:
         Returns:
             List of unique business dictionaries
             
+        See scrape_stream() for the flow; this collects its output into a list.
+        """
+        return [
+            business async for business in self.scrape_stream(
+                query,
+                target_count=target_count,
+                max_scrolls=max_scrolls,
+                seen_places=seen_places,
+                cursor=cursor
+            )
+        ]
+    
+    async def scrape_stream(
+        self,
+        query: str,
+        target_count: int = None,
+        max_scrolls: int = None,
+        seen_places: Optional[set] = None,
+        cursor: Optional[Any] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape Google Maps for a single query, yielding each business as soon
+        as it has been extracted, validated and deduplicated.
+        
+        Args:
+            query: Search term (e.g., "dentists in Amritsar")
+            target_count: How many unique cards to deliver
+            max_scrolls: Max scroll attempts
+            seen_places: Set of Place IDs user has already scraped (for deduplication)
+            cursor: ScrapeSessionCursor instance for resuming from previous position
+            
+        Yields:
+            Unique business dictionaries (at most target_count)
+            
         Flow:
             1. Open Google Maps
             2. Search query
             3. If cursor exists, restore scroll position (skip already-seen cards)
-            4. Scroll to load cards (continue until stale)
-            5. Collect ALL unique Place IDs from cards
-            6. Filter out already-seen places (if seen_places provided)
-            7. In parallel (4-5 at a time), extract details
-            8. Deduplicate by Place ID
-            9. Save cursor state for next resume
-            10. Return results
+            4. Scroller task scrolls the results and pushes each new, unseen
+               Place ID onto a card queue (continues until stale/target)
+            5. A dispatcher starts an extraction task per card; a semaphore
+               lets max_concurrent_cards run at once, and results go onto a
+               bounded output queue (all tasks gathered with
+               return_exceptions, so one failing card never stops the rest)
+            6. Results are validated, deduplicated by Place ID and yielded
+            7. Stop once target_count results were delivered or cards run out
+            8. Save cursor state for next resume
         """
         target_count = target_count or settings.DEFAULT_TARGET_COUNT
         seen_places = seen_places or set()
@@ -280,6 +682,15 @@ class GoogleMapsScraper:
         context = await self._create_context()
         page = await context.new_page()
         
+        max_concurrent = self.max_concurrent_cards
+        card_queue: asyncio.Queue = asyncio.Queue()
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent * 2)
+        extract_semaphore = asyncio.Semaphore(max_concurrent)
+        stop_scrolling = asyncio.Event()
+        collected_total = 0
+        scroller_task: Optional[asyncio.Task] = None
+        dispatcher_task: Optional[asyncio.Task] = None
+        
         try:
             # Set timeout
             page.set_default_timeout(settings.BROWSER_TIMEOUT)
@@ -292,7 +703,11 @@ class GoogleMapsScraper:
             
             # Navigate to Google Maps search
             logger.info(f"🌐 Navigating to: {search_url}")
-            await page.goto(search_url, wait_until='networkidle')
+            await page.goto(search_url, wait_until='domcontentloaded')
+            try:
+                await page.locator(RESULTS_READY_SELECTOR).first.wait_for(state='attached', timeout=10000)
+            except Exception:
+                logger.debug("⏱️ Timeout waiting for result cards")
             logger.info(f"✅ Page loaded successfully")
             
             # Update progress: Page loaded
@@ -334,65 +749,167 @@ class GoogleMapsScraper:
                 progress_percent=15
             )
             
-            card_links = await self._collect_unique_card_links(
-                page,
-                target_count=collection_target,
-                max_scrolls=max_scrolls,
-                seen_places=seen_places,
-                cursor=cursor
-            )
-            
-            # Save cursor state after collection (for next resume)
-            final_scroll_position = await self._get_current_scroll_position(page)
-            last_place_id = None
-            if card_links:
-                # Get the last place ID for anchor verification on next resume
-                last_place_id = list(card_links.keys())[-1] if card_links else None
-            
-            # Calculate total cards (previous + new)
-            previous_cards = cursor.cards_collected if cursor else 0
-            total_cards_now = previous_cards + len(card_links)
+            async def scroller() -> None:
+                """Scroll the results feed, feeding new cards to the dispatcher"""
+                nonlocal collected_total
+                try:
+                    card_links = await self._collect_unique_card_links(
+                        page,
+                        target_count=collection_target,
+                        max_scrolls=max_scrolls,
+                        seen_places=seen_places,
+                        cursor=cursor,
+                        card_queue=card_queue,
+                        stop_event=stop_scrolling
+                    )
+                    collected_total = len(card_links)
+                    
+                    # Save cursor state after collection (for next resume)
+                    final_scroll_position = await self._get_current_scroll_position(page)
+                    last_place_id = None
+                    if card_links:
+                        # Get the last place ID for anchor verification on next resume
+                        last_place_id = list(card_links.keys())[-1] if card_links else None
+                    
+                    # Calculate total cards (previous + new)
+                    previous_cards = cursor.cards_collected if cursor else 0
+                    total_cards_now = previous_cards + len(card_links)
+                    
+                    self._cursor_state = {
+                        'cards_collected': total_cards_now,
+                        'last_scroll_position': final_scroll_position,
+                        'last_place_id': last_place_id,
+                        'last_card_index': len(card_links) - 1 if card_links else None,
+                        'total_scrolls': self.stats['scrolls_performed'],
+                        'visible_card_count': len(card_links)
+                    }
+                    
+                    logger.info(f"✅ Collected {len(card_links)} unique card links")
+                    logger.info(f"📍 Cursor state: {total_cards_now} total cards, position {final_scroll_position}px")
+                    self.stats['cards_found'] = len(card_links) + self.stats.get('skipped_duplicates', 0)
+                    
+                    # Update progress: Scrolling done, extraction continues
+                    self._update_progress(
+                        status="extracting",
+                        phase=f"Extracting details from {len(card_links)} businesses...",
+                        progress_percent=30,
+                        cards_found=len(card_links)
+                    )
+                finally:
+                    # Sentinel: no more cards are coming
+                    card_queue.put_nowait(None)
             
-            self._cursor_state = {
-                'cards_collected': total_cards_now,
-                'last_scroll_position': final_scroll_position,
-                'last_place_id': last_place_id,
-                'last_card_index': len(card_links) - 1 if card_links else None,
-                'total_scrolls': self.stats['scrolls_performed'],
-                'visible_card_count': len(card_links)
-            }
+            async def extract_bounded(place_id: str, href: str, card_name: Optional[str]) -> None:
+                """Extract one card; the semaphore caps how many run at once"""
+                async with extract_semaphore:
+                    result = await self._extract_card_details(place_id, href, card_name)
+                    # Put while holding the slot, so a slow consumer throttles extraction
+                    if result:
+                        await result_queue.put(result)
             
-            logger.info(f"✅ Collected {len(card_links)} unique card links")
-            logger.info(f"📍 Cursor state: {total_cards_now} total cards, position {final_scroll_position}px")
-            self.stats['cards_found'] = len(card_links) + self.stats.get('skipped_duplicates', 0)
+            async def dispatcher() -> None:
+                """Start an extraction for every queued card, then gather them all"""
+                place_ids: List[str] = []
+                tasks: List[asyncio.Task] = []
+                try:
+                    while True:
+                        item = await card_queue.get()
+                        if item is None:
+                            break
+                        place_ids.append(item[0])
+                        tasks.append(asyncio.create_task(extract_bounded(*item)))
+                    
+                    # A failing card never cancels the others
+                    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+                    for place_id, outcome in zip(place_ids, outcomes):
+                        if isinstance(outcome, Exception):
+                            logger.error(f"Error extracting {place_id}: {outcome}")
+                            self.stats['extraction_errors'] += 1
+                    await result_queue.put(_EXTRACTION_DONE)
+                finally:
+                    # Cancelled (target reached / consumer gone): drop in-flight
+                    # cards, and retrieve failures of ones that already finished
+                    for task in tasks:
+                        if not task.done():
+                            task.cancel()
+                    if tasks:
+                        await asyncio.gather(*tasks, return_exceptions=True)
+            
+            logger.info(f"🔄 Extracting cards as they are found, {max_concurrent} at a time...")
+            scroller_task = asyncio.create_task(scroller())
+            dispatcher_task = asyncio.create_task(dispatcher())
+            
+            extracted_count = 0
+            delivered = 0
+            skipped_no_name = 0
+            
+            while True:
+                result = await result_queue.get()
+                if result is _EXTRACTION_DONE:
+                    break
+                
+                extracted_count += 1
+                # Update progress (30-95% range once the total is known)
+                if scroller_task.done() and collected_total:
+                    extraction_progress = 30 + int((min(extracted_count, collected_total) / collected_total) * 65)
+                    self._update_progress(
+                        progress_percent=extraction_progress,
+                        phase=f"Extracting... {extracted_count}/{collected_total} complete",
+                        cards_extracted=extracted_count,
+                        sample_result=result if result.get('name') else None
+                    )
+                else:
+                    self._update_progress(
+                        cards_extracted=extracted_count,
+                        sample_result=result if result.get('name') else None
+                    )
+                
+                # Skip results without valid names
+                name = result.get('name')
+                if not self._is_valid_business_name(name):
+                    skipped_no_name += 1
+                    logger.warning(f"⚠️ Skipping result without valid name: place_id={result.get('place_id', 'unknown')[:20]}, got: '{name}'")
+                    continue
+                
+                # Check dedup one more time
+                if not self.dedup_service.add_place(
+                    place_id=result.get('place_id'),
+                    cid=result.get('cid'),
+                    href=result.get('href'),
+                    name=name,
+                    address=result.get('address')
+                ):
+                    continue
+                
+                self.stats['cards_extracted'] += 1
+                delivered += 1
+                yield result
+                
+                if delivered >= target_count:
+                    logger.info(f"✂️ Reached requested target of {target_count} results")
+                    break
             
-            # Extract details from cards in parallel
-            logger.info(f"🔄 Starting parallel extraction of {len(card_links)} cards (skipped {self.stats.get('skipped_duplicates', 0)} duplicates)...")
-            results = await self._extract_details_parallel(
-                card_links,
-                max_concurrent=self.max_concurrent_cards
-            )
+            # Stop producers: no more scrolling, drop in-flight extractions
+            stop_scrolling.set()
+            dispatcher_task.cancel()
+            await asyncio.gather(dispatcher_task, return_exceptions=True)
+            await scroller_task  # Re-raises scroll errors; saves cursor state
             
-            # Limit to target count
-            original_count = len(results)
-            results = results[:target_count]
-            if original_count > target_count:
-                logger.info(f"✂️ Trimmed results from {original_count} to {target_count} (requested target)")
+            if skipped_no_name > 0:
+                logger.warning(f"⚠️ Skipped {skipped_no_name} results without valid names")
             
             # Update progress: Complete
             self._update_progress(
                 status="completed",
-                phase=f"✅ Complete! {len(results)} results found",
+                phase=f"✅ Complete! {delivered} results found",
                 progress_percent=100,
-                unique_results=len(results),
+                unique_results=delivered,
                 cards_extracted=self.stats['cards_extracted']
             )
             
-            logger.info(f"✅ Scrape complete: {len(results)} unique results delivered")
+            logger.info(f"✅ Scrape complete: {delivered} unique results delivered")
             logger.info(f"📊 Final stats: {self.stats['cards_extracted']} extracted, {self.stats['extraction_errors']} errors")
             
-            return results
-            
         except Exception as e:
             logger.error(f"Scrape error: {e}")
             # Update progress: Failed
@@ -403,6 +920,13 @@ class GoogleMapsScraper:
             )
             raise
         finally:
+            # Also reached when the consumer stops iterating early
+            stop_scrolling.set()
+            pending = [t for t in [scroller_task, dispatcher_task] if t and not t.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
             await context.close()
     
     async def _handle_consent_popup(self, page: Page) -> None:
@@ -478,12 +1002,6 @@ class GoogleMapsScraper:
             else:
                 logger.warning(f"⚠️ Scroll restoration inexact: {actual_scroll}px vs target {scroll_position}px")
             
-            # Wait for any AJAX loading to complete
-            try:
-                await page.wait_for_load_state('networkidle', timeout=5000)
-            except Exception:
-                pass
-            
             await self._random_delay(1.0, 2.0)
             return True
             
@@ -532,7 +1050,9 @@ class GoogleMapsScraper:
         target_count: int,
         max_scrolls: int = 50,
         seen_places: Optional[set] = None,
-        cursor: Optional[Any] = None
+        cursor: Optional[Any] = None,
+        card_queue: Optional[asyncio.Queue] = None,
+        stop_event: Optional[asyncio.Event] = None
     ) -> Dict[str, Tuple[str, Optional[str]]]:
         """
         Scroll through results and collect unique card links.
@@ -542,6 +1062,9 @@ class GoogleMapsScraper:
             target_count: Number of cards to collect
             max_scrolls: Maximum scroll attempts
             seen_places: Set of Place IDs user has already scraped (for deduplication)
+            card_queue: If given, each new card is also pushed as
+                        (place_id, href, card_name) as soon as it is found
+            stop_event: If given and set, scrolling stops before the next scroll
             
         Returns:
             Dictionary mapping place_id to (href, card_name) tuple
@@ -565,6 +1088,10 @@ class GoogleMapsScraper:
             max_consecutive_seen = 15  # Stop if we see 15+ cards in a row that user already has
         
         for scroll_num in range(max_scrolls):
+            if stop_event and stop_event.is_set():
+                logger.info("🛑 Stopping scroll: enough results delivered")
+                break
+            
             self.stats['scrolls_performed'] += 1
             
             # Find all card links currently visible
@@ -614,6 +1141,8 @@ class GoogleMapsScraper:
                             
                             # Store as tuple: (href, card_name)
                             card_links[place_id] = (href, card_name)
+                            if card_queue is not None:
+                                card_queue.put_nowait((place_id, href, card_name))
                             
                             if len(card_links) >= target_count:
                                 logger.info(f"✅ Reached target count: {target_count}")
@@ -716,107 +1245,6 @@ class GoogleMapsScraper:
             # Fallback scroll
             await page.keyboard.press('PageDown')
     
-    async def _extract_details_parallel(
-        self,
-        card_links: Dict[str, Tuple[str, Optional[str]]],
-        max_concurrent: int = 4
-    ) -> List[Dict[str, Any]]:
-        """
-        Extract details from multiple cards in parallel.
-        
-        Args:
-            card_links: Dictionary mapping place_id to (href, card_name) tuple
-            max_concurrent: Maximum concurrent extractions
-            
-        Returns:
-            List of business detail dictionaries
-        """
-        results: List[Dict[str, Any]] = []
-        semaphore = asyncio.Semaphore(max_concurrent)
-        extracted_count = 0
-        total_tasks = len(card_links)
-        
-        # Update progress: Starting extraction phase
-        self._update_progress(
-            status="extracting",
-            phase=f"Extracting details from {total_tasks} businesses...",
-            progress_percent=30,
-            cards_found=total_tasks
-        )
-        
-        async def extract_with_semaphore(place_id: str, href: str, card_name: Optional[str], index: int) -> Optional[Dict]:
-            nonlocal extracted_count
-            async with semaphore:
-                try:
-                    result = await self._extract_card_details(place_id, href, card_name)
-                    if result:
-                        extracted_count += 1
-                        # Update progress (30-95% range for extraction)
-                        extraction_progress = 30 + int((extracted_count / total_tasks) * 65)
-                        self._update_progress(
-                            progress_percent=extraction_progress,
-                            phase=f"Extracting... {extracted_count}/{total_tasks} complete",
-                            cards_extracted=extracted_count,
-                            sample_result=result if result.get('name') else None
-                        )
-                    return result
-                except Exception as e:
-                    logger.error(f"Error extracting {place_id}: {e}")
-                    self.stats['extraction_errors'] += 1
-                    return None
-        
-        # Create extraction tasks - unpack (href, card_name) tuple
-        tasks = [
-            extract_with_semaphore(place_id, href_name[0], href_name[1], i)
-            for i, (place_id, href_name) in enumerate(card_links.items())
-        ]
-        
-        logger.info(f"🔄 Extracting {len(tasks)} cards with {max_concurrent} concurrent workers...")
-        
-        # Execute all tasks
-        extracted = await asyncio.gather(*tasks)
-        
-        # Count successfully extracted
-        extracted_count = sum(1 for r in extracted if r is not None)
-        logger.info(f"✅ Extraction complete: {extracted_count}/{total_tasks} cards successfully extracted")
-        
-        # Update progress: Processing results
-        self._update_progress(
-            progress_percent=95,
-            phase="Processing and deduplicating results..."
-        )
-        
-        # Filter out None results and results without valid names
-        skipped_no_name = 0
-        for result in extracted:
-            if result is None:
-                continue
-            
-            # Use the new validation method
-            name = result.get('name')
-            if not self._is_valid_business_name(name):
-                skipped_no_name += 1
-                logger.warning(f"⚠️ Skipping result without valid name: place_id={result.get('place_id', 'unknown')[:20]}, got: '{name}'")
-                continue
-            
-            # Check dedup one more time
-            if self.dedup_service.add_place(
-                place_id=result.get('place_id'),
-                cid=result.get('cid'),
-                href=result.get('href'),
-                name=name,
-                address=result.get('address')
-            ):
-                results.append(result)
-                self.stats['cards_extracted'] += 1
-        
-        if skipped_no_name > 0:
-            logger.warning(f"⚠️ Skipped {skipped_no_name} results without valid names")
-        
-        logger.info(f"✅ Valid results after filtering: {len(results)}")
-        
-        return results
-    
     async def _extract_card_details(
         self,
         place_id: str,
@@ -839,21 +1267,23 @@ class GoogleMapsScraper:
         Returns:
             Business details dictionary or None on error
         """
-        context = await self._create_context()
-        page = await context.new_page()
+        context = await self._acquire_context()
+        page = None
         
         try:
+            page = await context.new_page()
             page.set_default_timeout(settings.BROWSER_TIMEOUT)
             
             # Step 1: Navigate to the SEARCH RESULTS page first (not the place URL)
             # This is critical - we need to click from search results to trigger data loading
             if self._current_search_url:
+                # Anti-bot jitter goes before navigation; after it we only wait on the DOM
+                await self._random_delay(1.0, 2.0)
                 logger.debug(f"📍 Loading search results for card click: {place_id[:20]}")
                 await page.goto(self._current_search_url, wait_until='domcontentloaded')
                 
                 # Wait for search results to load
-                await page.wait_for_selector('a[href*="/maps/place/"]', timeout=10000)
-                await self._random_delay(1.0, 2.0)
+                await page.wait_for_selector(RESULTS_READY_SELECTOR, timeout=10000)
                 
                 # Handle consent popup if it appears
                 await self._handle_consent_popup(page)
@@ -897,30 +1327,14 @@ class GoogleMapsScraper:
                 
                 # Step 3: Wait for sidebar to fully populate with business details
                 # Google populates the sidebar AFTER click, not during page load
-                try:
-                    # Wait for actual business name content (not just h1 element)
-                    await page.wait_for_function(
-                        "document.querySelector('h1')?.textContent?.trim()?.length > 0",
-                        timeout=8000
-                    )
-                except Exception:
-                    logger.debug(f"⏱️ Timeout waiting for h1 content on {place_id[:20]}")
-                
-                # Wait for network to settle (AJAX calls completing)
-                try:
-                    await page.wait_for_load_state('networkidle', timeout=5000)
-                except Exception:
-                    pass
-                
-                # Additional delay for dynamic content
-                await self._random_delay(2.0, 3.5)
+                await self._wait_for_place_ready(page, place_id)
                 
             else:
                 # Fallback if no search URL stored (shouldn't happen)
                 logger.warning(f"No search URL stored, using direct navigation for {place_id[:20]}")
                 full_url = href if href.startswith('http') else f"https://www.google.com{href}"
-                await page.goto(full_url, wait_until='networkidle')
-                await self._random_delay(3.0, 5.0)
+                await page.goto(full_url, wait_until='domcontentloaded')
+                await self._wait_for_place_ready(page, place_id)
             
             # Step 4: Extract from the NOW-POPULATED sidebar/page
             details = await self._extract_business_info(page)
@@ -952,13 +1366,32 @@ class GoogleMapsScraper:
             logger.error(f"❌ Error extracting {place_id}: {str(e)[:100]}")
             return None
         finally:
-            await context.close()
+            if page:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            await self._release_context(context)
+    
+    async def _wait_for_place_ready(self, page: Page, place_id: str) -> None:
+        """Wait until the place header and its detail rows are visible (sidebar has been populated)"""
+        try:
+            await page.locator(PLACE_READY_SELECTOR).first.wait_for(state='visible', timeout=5000)
+        except Exception:
+            logger.debug(f"⏱️ Timeout waiting for place header on {place_id[:20]}")
+        
+        # Detail rows (address, rating, website) arrive shortly after the header
+        try:
+            await page.locator(SIDEBAR_READY_SELECTOR).first.wait_for(state='visible', timeout=3500)
+        except Exception:
+            logger.debug(f"⏱️ Timeout waiting for sidebar details on {place_id[:20]}")
     
     async def _extract_business_info(self, page: Page) -> Dict[str, Any]:
         """
         Extract all business information from the place page.
-        Updated Jan 2026 with new Google Maps selectors.
-        Uses aria-label extraction as primary method (Google's accessibility approach).
+        Calls the EXTRACT_JS copy installed by the context init script so every
+        field is read in a single round-trip (sending EXTRACT_JS itself if the
+        page has no copy); falls back to the per-selector ladder if it throws.
         
         Args:
             page: Playwright page object on a place detail page
@@ -966,323 +1399,283 @@ class GoogleMapsScraper:
         Returns:
             Dictionary with business information
         """
-        info = {
-            'name': None,
-            'address': None,
-            'phone': None,
-            'website': None,
-            'rating': None,
-            'reviews_count': None,
-            'category': None,
-            'hours': None,
-            'latitude': None,
-            'longitude': None,
-            'is_claimed': False,
-            'photo_url': None
-        }
+        try:
+            info = await page.evaluate(CALL_EXTRACT_JS)
+            if info is None:
+                info = await page.evaluate(EXTRACT_JS)
+        except Exception as e:
+            logger.debug(f"Batched extraction failed, using selector fallback: {e}")
+            return await self._extract_business_info_fallback(page)
+        
+        if not info.get('name'):
+            await self._log_name_diagnostics(page)
+        
+        return info
+    
+    async def _log_name_diagnostics(self, page: Page) -> None:
+        """
+        Log page diagnostics when business name extraction failed.
+        The HTML/h1 dump is only collected when SCRAPER_DEBUG_DOM is enabled,
+        since serializing the page body can transfer megabytes per failed card.
+        """
+        logger.warning(f"⚠️ Failed to extract name. Page URL: {page.url}")
+        if not self._debug_dom:
+            return
         
         try:
-            # === BUSINESS NAME EXTRACTION (Priority Order) ===
-            # Method 1: Try aria-label on header elements first (most reliable in 2026)
-            name_aria_selectors = [
-                'div[role="main"] h1',           # Main content h1
-                'h1[aria-label]',                 # H1 with aria-label
-                '*[data-item-id*="title"]',      # Data attribute approach
-            ]
-            
-            # Try aria-label extraction first
-            for selector in name_aria_selectors:
-                try:
-                    element = page.locator(selector).first
-                    if await element.count() > 0:
-                        # Try aria-label attribute
-                        aria_label = await element.get_attribute('aria-label')
-                        if aria_label and aria_label.strip():
-                            info['name'] = aria_label.strip()
-                            break
-                        # Fallback to text content
-                        text = await element.inner_text()
-                        if text and text.strip():
-                            info['name'] = text.strip()
-                            break
-                except Exception:
-                    continue
-            
-            # Method 2: Traditional CSS selectors if aria-label failed
-            if not info['name']:
-                name_selectors = [
-                    "h1.DUwDvf.lfPIob",          # Primary selector (2026)
-                    "h1.DUwDvf",                  # Simplified primary
-                    "h1.fontHeadlineLarge",       # Fallback 1
-                    "div.lMbq3e h1",              # Fallback 2  
-                    "h1[class*='fontHeadline']",  # Pattern match
-                    "div[role='main'] h1",        # Role-based
-                    "h1",                         # Last resort
-                ]
-                info['name'] = await self._safe_get_text_chain(page, name_selectors)
-            
-            # Method 3: Extract from page title as ultimate fallback
-            if not info['name']:
+            # Get HTML snippet for debugging
+            html_snippet = await page.locator('body').first.inner_html()
+            logger.debug(f"HTML snippet (first 800 chars): {html_snippet[:800]}")
+            # Log all h1 elements found
+            h1_elements = await page.locator('h1').all()
+            h1_texts = []
+            for h1 in h1_elements:
                 try:
-                    page_title = await page.title()
-                    if page_title and ' - Google Maps' in page_title:
-                        info['name'] = page_title.replace(' - Google Maps', '').strip()
-                except Exception:
+                    h1_texts.append(await h1.inner_text())
+                except:
                     pass
+            if h1_texts:
+                logger.warning(f"H1 elements found: {h1_texts}")
+        except Exception as diag_error:
+            logger.debug(f"Diagnostic logging failed: {diag_error}")
+    
+    async def _extract_business_info_fallback(self, page: Page) -> Dict[str, Any]:
+        """
+        Extract business information one field at a time.
+        Updated Jan 2026 with new Google Maps selectors.
+        Uses aria-label extraction as primary method (Google's accessibility approach).
+        Only used when the batched EXTRACT_JS evaluation fails.
+        
+        The per-field reads are independent, so they are issued concurrently
+        and Playwright pipelines the round-trips over the same connection.
+        
+        Args:
+            page: Playwright page object on a place detail page
             
-            # Log diagnostic if name extraction failed
-            if not info['name']:
-                try:
-                    # Get HTML snippet for debugging
-                    html_snippet = await page.locator('body').first.inner_html()
-                    logger.warning(f"⚠️ Failed to extract name. Page URL: {page.url}")
-                    logger.debug(f"HTML snippet (first 800 chars): {html_snippet[:800]}")
-                    # Log all h1 elements found
-                    h1_elements = await page.locator('h1').all()
-                    h1_texts = []
-                    for h1 in h1_elements:
-                        try:
-                            h1_texts.append(await h1.inner_text())
-                        except:
-                            pass
-                    if h1_texts:
-                        logger.warning(f"H1 elements found: {h1_texts}")
-                except Exception as diag_error:
-                    logger.debug(f"Diagnostic logging failed: {diag_error}")
-            
-            # === RATING EXTRACTION (aria-label is most reliable) ===
-            # Method 1: Extract from aria-label containing "stars" (most reliable)
-            try:
-                # Look for any element with aria-label containing star rating
-                star_elements = await page.locator('*[aria-label*="star"]').all()
-                for star_el in star_elements[:5]:  # Check first 5 matches
-                    try:
-                        aria_label = await star_el.get_attribute('aria-label')
-                        if aria_label:
-                            # Match patterns like "4.5 stars" or "4,5 stars"
-                            rating_match = re.search(r'([\d.,]+)\s*star', aria_label, re.IGNORECASE)
-                            if rating_match:
-                                rating_str = rating_match.group(1).replace(',', '.')
-                                info['rating'] = float(rating_str)
-                                break
-                    except Exception:
-                        continue
-            except Exception:
-                pass
-            
-            # Method 2: Traditional selectors if aria-label failed
-            if not info['rating']:
-                rating_selectors = [
-                    "div.F7nice span[aria-hidden='true']",  # Primary 2026
-                    "span.ceNzKf[role='img']",              # Alternative
-                    "div.fontBodyMedium span[aria-hidden='true']",  # Another variant
-                ]
-                for selector in rating_selectors:
-                    try:
-                        rating_el = page.locator(selector).first
-                        if await rating_el.count() > 0:
-                            rating_text = await rating_el.inner_text()
-                            if rating_text:
-                                # Clean and parse rating
-                                rating_clean = rating_text.strip().replace(',', '.')
-                                if rating_clean and rating_clean[0].isdigit():
-                                    info['rating'] = float(rating_clean)
-                                    break
-                    except Exception:
-                        continue
-            
-            # Reviews count - Updated selectors for 2026
-            try:
-                # Try getting reviews from button with aria-label
-                reviews_el = page.locator("div.F7nice button[aria-label*='reviews']").first
-                if await reviews_el.count() > 0:
-                    aria_label = await reviews_el.get_attribute('aria-label')
-                    if aria_label:
-                        reviews_match = re.search(r'([\d,]+)', aria_label)
-                        if reviews_match:
-                            info['reviews_count'] = int(reviews_match.group(1).replace(',', ''))
-            except Exception:
-                pass
-            
-            if not info['reviews_count']:
-                reviews_text = await self._safe_get_text(page, 'button[aria-label*="review"]')
-                if not reviews_text:
-                    reviews_text = await self._safe_get_text(page, 'span[aria-label*="review"]')
-                if reviews_text:
-                    reviews_match = re.search(r'([\d,]+)\s*review', reviews_text)
-                    if reviews_match:
-                        info['reviews_count'] = int(reviews_match.group(1).replace(',', ''))
-            
-            # Category - Updated selectors for 2026
-            category_selectors = [
-                "button.DkEaL",                   # Primary 2026
-                "button[jsaction*='category']",   # Fallback
-                "span.DkEaL",                     # Alternative
-            ]
-            info['category'] = await self._safe_get_text_chain(page, category_selectors)
-            
-            # === ADDRESS EXTRACTION (aria-label primary) ===
-            # Method 1: aria-label containing "Address:"
-            try:
-                address_elements = await page.locator('*[aria-label*="Address"]').all()
-                for addr_el in address_elements[:3]:
-                    try:
-                        aria_label = await addr_el.get_attribute('aria-label')
-                        if aria_label and 'Address:' in aria_label:
-                            info['address'] = aria_label.replace('Address:', '').strip()
-                            break
-                    except Exception:
-                        continue
-            except Exception:
-                pass
-            
-            # Method 2: data-item-id approach
-            if not info['address']:
-                address_button = page.locator('button[data-item-id="address"]')
-                if await address_button.count() > 0:
-                    info['address'] = await self._safe_get_attribute(
-                        page,
-                        'button[data-item-id="address"]',
-                        'aria-label'
-                    )
-                    if info['address']:
-                        info['address'] = info['address'].replace('Address:', '').strip()
-            
-            # Method 3: Text-based fallback
-            if not info['address']:
-                info['address'] = await self._safe_get_text(
-                    page,
-                    'button[aria-label*="Address"]'
-                )
-                if info['address']:
-                    info['address'] = info['address'].replace('Address:', '').strip()
-            
-            # === PHONE EXTRACTION (aria-label primary) ===
-            # Method 1: aria-label containing "Phone:"
-            try:
-                phone_elements = await page.locator('*[aria-label*="Phone"]').all()
-                for phone_el in phone_elements[:3]:
-                    try:
-                        aria_label = await phone_el.get_attribute('aria-label')
-                        if aria_label and 'Phone:' in aria_label:
-                            info['phone'] = aria_label.replace('Phone:', '').strip()
-                            break
-                    except Exception:
-                        continue
-            except Exception:
-                pass
-            
-            # Method 2: data-item-id approach
-            if not info['phone']:
-                phone_button = page.locator('button[data-item-id*="phone"]')
-                if await phone_button.count() > 0:
-                    info['phone'] = await self._safe_get_attribute(
-                        page,
-                        'button[data-item-id*="phone"]',
-                        'aria-label'
-                    )
-                    if info['phone']:
-                        info['phone'] = info['phone'].replace('Phone:', '').strip()
-            
-            # Method 3: Text-based fallback
-            if not info['phone']:
-                info['phone'] = await self._safe_get_text(
-                    page,
-                    'button[aria-label*="Phone"]'
-                )
-                if info['phone']:
-                    info['phone'] = info['phone'].replace('Phone:', '').strip()
-            
-            # Website
-            website_link = page.locator('a[data-item-id="authority"]')
-            if await website_link.count() > 0:
-                info['website'] = await website_link.first.get_attribute('href')
-            
-            # Opening hours
-            hours_element = page.locator('div[aria-label*="hour"]')
-            if await hours_element.count() > 0:
-                info['hours'] = await self._safe_get_attribute(
-                    page,
-                    'div[aria-label*="hour"]',
-                    'aria-label'
-                )
-            
-            # Is claimed
-            claimed_element = page.locator('span:has-text("Claimed")')
-            info['is_claimed'] = await claimed_element.count() > 0
+        Returns:
+            Dictionary with business information
+        """
+        info = BusinessInfo()
+        
+        try:
+            (
+                name, rating, reviews_count, category, address,
+                phone, website, hours, is_claimed, coords, photo_url
+            ) = await asyncio.gather(
+                self._extract_name(page),
+                self._extract_rating(page),
+                self._extract_reviews(page),
+                self._extract_category(page),
+                self._extract_address(page),
+                self._extract_phone(page),
+                self._extract_website(page),
+                self._extract_hours(page),
+                self._extract_claimed(page),
+                self._extract_coords(page),
+                self._extract_photo(page),
+            )
             
-            # Try to get coordinates from URL
-            current_url = page.url
-            coords_match = re.search(r'@(-?\d+\.?\d*),(-?\d+\.?\d*)', current_url)
-            if coords_match:
-                info['latitude'] = float(coords_match.group(1))
-                info['longitude'] = float(coords_match.group(2))
+            info = BusinessInfo(
+                name=name,
+                rating=rating,
+                reviews_count=reviews_count,
+                category=category,
+                address=address,
+                phone=phone,
+                website=website,
+                hours=hours,
+                is_claimed=is_claimed,
+                photo_url=photo_url,
+            )
+            if coords:
+                info.latitude, info.longitude = coords
             
-            # Photo URL (main image)
-            img_element = page.locator('img[decoding="async"]').first
-            if await img_element.count() > 0:
-                info['photo_url'] = await img_element.get_attribute('src')
+            # Log diagnostic if name extraction failed
+            if not info.name:
+                await self._log_name_diagnostics(page)
                 
         except Exception as e:
             logger.warning(f"Error extracting business info: {e}")
         
-        return info
+        return asdict(info)
+    
+    async def _extract_name(self, page: Page) -> Optional[str]:
+        """
+        Extract business name in a single round-trip.
+        NAME_JS walks the aria-label selectors, then the CSS ladder, then the
+        page title, and returns the first non-empty value.
+        """
+        try:
+            return await page.evaluate(NAME_JS, NAME_ARIA_SELECTORS + NAME_SELECTORS)
+        except Exception as e:
+            logger.debug(f"Name extraction failed: {e}")
+            return None
     
-    async def _safe_get_text(self, page: Page, selector: str) -> Optional[str]:
-        """Safely get text content from a selector"""
+    async def _extract_rating(self, page: Page) -> Optional[float]:
+        """Extract star rating (aria-label is most reliable)"""
+        # Method 1: Extract from aria-label containing "stars"
+        # Filtered in the page: returns the number from the first "4.5 stars" label
         try:
-            element = page.locator(selector).first
-            if await element.count() > 0:
-                text = await element.text_content()
-                return text.strip() if text else None
+            rating_str = await page.eval_on_selector_all('*[aria-label*="star"]', FIRST_STAR_RATING_JS)
+            if rating_str:
+                return float(rating_str.replace(',', '.'))
         except Exception:
             pass
+        
+        # Method 2: Traditional selectors if aria-label failed
+        rating_selectors = [
+            "div.F7nice span[aria-hidden='true']",  # Primary 2026
+            "span.ceNzKf[role='img']",              # Alternative
+            "div.fontBodyMedium span[aria-hidden='true']",  # Another variant
+        ]
+        for selector in rating_selectors:
+            values = await self._batch_read(page, selector, ('innerText',))
+            if values:
+                # Clean and parse rating
+                rating_clean = values['innerText'].replace(',', '.')
+                if rating_clean[0].isdigit():
+                    try:
+                        return float(rating_clean)
+                    except ValueError:
+                        continue
+        
         return None
     
-    async def _safe_get_text_chain(self, page: Page, selectors: List[str]) -> Optional[str]:
-        """
-        Try multiple selectors until one returns text.
-        Useful when Google changes their HTML structure.
+    async def _extract_reviews(self, page: Page) -> Optional[int]:
+        """Extract reviews count"""
+        # Try getting reviews from button with aria-label
+        values = await self._batch_read(page, "div.F7nice button[aria-label*='reviews']", ('aria-label',))
+        if values:
+            reviews_count = _parse_count_label(values['aria-label'])
+            if reviews_count:
+                return reviews_count
+        
+        values = await self._batch_read(
+            page,
+            ['button[aria-label*="review"]', 'span[aria-label*="review"]'],
+            ('textContent',)
+        )
+        if values:
+            reviews_match = _RE_REVIEW_COUNT.search(values['textContent'])
+            if reviews_match:
+                return int(reviews_match.group(1).replace(',', ''))
         
-        Args:
-            page: Playwright page object
-            selectors: List of CSS selectors to try in order
-            
-        Returns:
-            Text content from the first matching selector, or None
-        """
-        for selector in selectors:
-            try:
-                element = page.locator(selector).first
-                if await element.count() > 0:
-                    # Try inner_text first (more reliable for visible text)
-                    text = await element.inner_text()
-                    if text and text.strip():
-                        return text.strip()
-                    # Fallback to text_content
-                    text = await element.text_content()
-                    if text and text.strip():
-                        return text.strip()
-            except Exception:
-                continue
         return None
     
-    async def _safe_get_attribute(
+    async def _extract_category(self, page: Page) -> Optional[str]:
+        """Extract business category"""
+        category_selectors = [
+            "button.DkEaL",                   # Primary 2026
+            "button[jsaction*='category']",   # Fallback
+            "span.DkEaL",                     # Alternative
+        ]
+        values = await self._batch_read(page, category_selectors, ('innerText', 'textContent'))
+        return (values['innerText'] or values['textContent']) if values else None
+    
+    async def _extract_labelled_field(
         self,
         page: Page,
-        selector: str,
-        attribute: str
+        label: str,
+        data_item_selector: str
     ) -> Optional[str]:
-        """Safely get an attribute from a selector"""
+        """
+        Extract a "Label: value" field such as Address or Phone.
+        
+        Tries aria-label containing "Label:", then the data-item-id button's
+        aria-label, then the button text.
+        """
+        marker = f"{label}:"
+        
+        # Method 1: aria-label containing "Label:" (filtered in the page)
         try:
-            element = page.locator(selector).first
-            if await element.count() > 0:
-                value = await element.get_attribute(attribute)
-                return value.strip() if value else None
+            aria_label = await page.eval_on_selector_all(
+                f'*[aria-label*="{label}"]',
+                FIRST_LABEL_WITH_MARKER_JS,
+                marker
+            )
+            if aria_label:
+                return aria_label.replace(marker, '').strip()
         except Exception:
             pass
+        
+        # Method 2: data-item-id approach
+        values = await self._batch_read(page, data_item_selector, ('aria-label',))
+        if values:
+            return values['aria-label'].replace(marker, '').strip()
+        
+        # Method 3: Text-based fallback
+        values = await self._batch_read(page, f'button[aria-label*="{label}"]', ('textContent',))
+        if values:
+            return values['textContent'].replace(marker, '').strip()
+        
         return None
     
+    async def _extract_address(self, page: Page) -> Optional[str]:
+        """Extract street address"""
+        return await self._extract_labelled_field(page, 'Address', 'button[data-item-id="address"]')
+    
+    async def _extract_phone(self, page: Page) -> Optional[str]:
+        """Extract phone number"""
+        return await self._extract_labelled_field(page, 'Phone', 'button[data-item-id*="phone"]')
+    
+    async def _extract_website(self, page: Page) -> Optional[str]:
+        """Extract website link"""
+        values = await self._batch_read(page, 'a[data-item-id="authority"]', ('href',))
+        return values['href'] if values else None
+    
+    async def _extract_hours(self, page: Page) -> Optional[str]:
+        """Extract opening hours"""
+        values = await self._batch_read(page, 'div[aria-label*="hour"]', ('aria-label',))
+        return values['aria-label'] if values else None
+    
+    async def _extract_claimed(self, page: Page) -> bool:
+        """Check whether the listing is claimed"""
+        try:
+            return bool(await page.evaluate(IS_CLAIMED_JS))
+        except Exception:
+            return False
+    
+    async def _extract_coords(self, page: Page) -> Optional[Tuple[float, float]]:
+        """Extract (latitude, longitude) from the current URL"""
+        coords_match = _RE_COORDS.search(page.url)
+        if coords_match:
+            return float(coords_match.group(1)), float(coords_match.group(2))
+        return None
+    
+    async def _extract_photo(self, page: Page) -> Optional[str]:
+        """Extract main photo URL"""
+        values = await self._batch_read(page, 'img[decoding="async"]', ('src',))
+        return values['src'] if values else None
+    
+    async def _batch_read(
+        self,
+        page: Page,
+        selectors: Union[str, List[str]],
+        attrs: Tuple[str, ...] = ('aria-label', 'textContent')
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Read several attributes from the first matching element in one round-trip.
+        
+        Replaces the locator/count/get_attribute sequence (three CDP calls per
+        selector) with a single evaluate. Passing a list of selectors tries them
+        in order inside the page, so a whole fallback chain costs one call.
+        
+        Args:
+            page: Playwright page object
+            selectors: CSS selector, or list of selectors to try in order
+            attrs: Attributes to read; 'innerText'/'textContent' read the DOM property
+            
+        Returns:
+            Dict of stripped values (None where empty), or None if nothing matched
+        """
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        try:
+            return await page.evaluate(BATCH_READ_JS, [list(selectors), list(attrs)])
+        except Exception as e:
+            logger.debug(f"Batch read failed for {selectors}: {e}")
+            return None
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get scraping statistics including cursor state"""
         return {
@@ -15,16 +15,74 @@ Usage:
 
 import re
 import logging
-from typing import List, Optional, Dict, Any
+from collections import defaultdict
+from typing import List, Optional, Dict, Any, Pattern, Sequence, Tuple, Union
 from playwright.async_api import Page
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns (extraction runs once per card)
+_RE_STARS = re.compile(r'([\d.]+)\s*star')
+_RE_NUM = re.compile(r'([\d,]+)')
+# Place URL metadata (coords, place ID, CID coords) in one match. Each part is an
+# independent optional lookahead anchored at the start, so missing parts simply
+# leave their groups as None.
+_URL_META = re.compile(
+    r'^(?=(?:.*?@(?P<lat>-?\d+\.?\d*),(?P<lng>-?\d+\.?\d*))?)'
+    r'(?=(?:.*?!1s(?P<pid>0x[a-f0-9:]+))?)'
+    r'(?=(?:.*?!8m2!3d(?P<cid_lat>[\d.]+)!4d(?P<cid_lng>[\d.]+))?)',
+    re.DOTALL
+)
+_RE_PHONE_LABEL = re.compile(r'Phone:\s*(.+)')
+_RE_ADDRESS_LABEL = re.compile(r'Address:\s*(.+)')
+_RE_HOURS_LABEL = re.compile(r'Hours:\s*(.+)')
+
+# Selector hit statistics, kept per selector chain (keyed by the chain's
+# hand-written selector tuple) and used to try the selector that usually matches
+# first. The canonical lists (e.g. GOOGLE_MAPS_SELECTORS) are never modified;
+# callers may rely on their positions. asyncio is single-threaded, so plain
+# counters are safe.
+_HIT_COUNTS: Dict[Tuple[str, ...], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+_RANKED_SELECTORS: Dict[Tuple[str, ...], List[str]] = {}
+_REORDER_EVERY = 100
+_hits_since_reorder = 0
+
+
+def _ranked_selectors(chain: Tuple[str, ...]) -> Sequence[str]:
+    """Get the chain's selectors in current rank order (hand-written order until ranked)."""
+    return _RANKED_SELECTORS.get(chain, chain)
+
+
+def _record_selector_hit(chain: Tuple[str, ...], selector: str) -> None:
+    """Count a successful selector and periodically re-rank every chain."""
+    global _hits_since_reorder
+    _HIT_COUNTS[chain][selector] += 1
+    _hits_since_reorder += 1
+    if _hits_since_reorder >= _REORDER_EVERY:
+        _hits_since_reorder = 0
+        _reorder_selectors()
+
+
+def _reorder_selectors() -> None:
+    """
+    Rank each chain's selectors by descending hit count.
+    
+    New lists are assigned (rather than sorting in place) so chains already
+    iterating the old order are unaffected. The sort is stable, so selectors
+    with equal counts keep their hand-written priority.
+    """
+    for chain, counts in _HIT_COUNTS.items():
+        _RANKED_SELECTORS[chain] = sorted(chain, key=lambda sel: -counts[sel])
+
 
 class SelectorChain:
     """
     Try multiple selectors until one works.
     Essential for scraping Google Maps which changes selectors frequently.
+    
+    Successful selectors are counted per chain, and each chain is periodically
+    re-ranked so the usual winner is tried first. The lists passed in are
+    never reordered.
     """
     
     @staticmethod
@@ -44,17 +102,20 @@ class SelectorChain:
         Returns:
             Text content from first matching selector, or fallback
         """
-        for selector in selectors:
+        chain = tuple(selectors)
+        for selector in _ranked_selectors(chain):
             try:
                 element = page.locator(selector).first
                 if await element.count() > 0:
                     # Try inner_text first (visible text only)
                     text = await element.inner_text()
                     if text and text.strip():
+                        _record_selector_hit(chain, selector)
                         return text.strip()
                     # Fallback to text_content (includes hidden text)
                     text = await element.text_content()
                     if text and text.strip():
+                        _record_selector_hit(chain, selector)
                         return text.strip()
             except Exception as e:
                 logger.debug(f"Selector failed '{selector}': {e}")
@@ -81,12 +142,14 @@ class SelectorChain:
         Returns:
             Attribute value from first matching selector, or fallback
         """
-        for selector in selectors:
+        chain = tuple(selectors)
+        for selector in _ranked_selectors(chain):
             try:
                 element = page.locator(selector).first
                 if await element.count() > 0:
                     attr = await element.get_attribute(attribute)
                     if attr:
+                        _record_selector_hit(chain, selector)
                         return attr.strip()
             except Exception as e:
                 logger.debug(f"Selector failed '{selector}' for attribute '{attribute}': {e}")
@@ -98,7 +161,7 @@ class SelectorChain:
     async def extract_from_aria_label(
         page: Page,
         selector: str,
-        pattern: str,
+        pattern: Union[str, Pattern[str]],
         group: int = 1
     ) -> Optional[str]:
         """
@@ -107,18 +170,20 @@ class SelectorChain:
         Args:
             page: Playwright page object
             selector: CSS selector for element with aria-label
-            pattern: Regex pattern to extract from aria-label
+            pattern: Regex pattern (string or precompiled) to extract from aria-label
             group: Regex group number to return
             
         Returns:
             Matched text or None
         """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
         try:
             element = page.locator(selector).first
             if await element.count() > 0:
                 aria_label = await element.get_attribute("aria-label")
                 if aria_label:
-                    match = re.search(pattern, aria_label)
+                    match = pattern.search(aria_label)
                     if match:
                         return match.group(group).strip()
         except Exception as e:
@@ -204,7 +269,7 @@ async def extract_business_details_v2(page: Page, card_url: str) -> Optional[Dic
                     if "aria-label" in selector:
                         aria = await el.get_attribute("aria-label")
                         if aria:
-                            match = re.search(r'([\d.]+)\s*star', aria)
+                            match = _RE_STARS.search(aria)
                             if match:
                                 rating = float(match.group(1))
                                 break
@@ -224,7 +289,7 @@ async def extract_business_details_v2(page: Page, card_url: str) -> Optional[Dic
                 if await el.count() > 0:
                     aria = await el.get_attribute("aria-label")
                     if aria:
-                        match = re.search(r'([\d,]+)', aria)
+                        match = _RE_NUM.search(aria)
                         if match:
                             reviews_count = int(match.group(1).replace(",", ""))
                             break
@@ -238,7 +303,7 @@ async def extract_business_details_v2(page: Page, card_url: str) -> Optional[Dic
         phone = await SelectorChain.extract_from_aria_label(
             page, 
             GOOGLE_MAPS_SELECTORS["phone"][0],
-            r'Phone:\s*(.+)'
+            _RE_PHONE_LABEL
         )
         
         # Website
@@ -252,14 +317,14 @@ async def extract_business_details_v2(page: Page, card_url: str) -> Optional[Dic
         address = await SelectorChain.extract_from_aria_label(
             page,
             GOOGLE_MAPS_SELECTORS["address"][0],
-            r'Address:\s*(.+)'
+            _RE_ADDRESS_LABEL
         )
         
         # Hours
         hours = await SelectorChain.extract_from_aria_label(
             page,
             GOOGLE_MAPS_SELECTORS["hours"][0],
-            r'Hours:\s*(.+)'
+            _RE_HOURS_LABEL
         )
         if not hours:
             hours = await SelectorChain.get_attribute(
@@ -268,30 +333,18 @@ async def extract_business_details_v2(page: Page, card_url: str) -> Optional[Dic
                 "aria-label"
             )
         
-        # Extract Place ID and CID from URL
-        place_id = None
+        # Extract Place ID, CID and coordinates from URL (single pass)
+        url_meta = _URL_META.match(card_url)
+        place_id = url_meta.group('pid')
         cid = None
-        try:
-            place_match = re.search(r'!1s(0x[a-f0-9:]+)', card_url)
-            if place_match:
-                place_id = place_match.group(1)
-            
-            cid_match = re.search(r'!8m2!3d([\d.]+)!4d([\d.]+)', card_url)
-            if cid_match:
-                cid = f"{cid_match.group(1)}_{cid_match.group(2)}"
-        except Exception:
-            pass
+        if url_meta.group('cid_lat'):
+            cid = f"{url_meta.group('cid_lat')}_{url_meta.group('cid_lng')}"
         
-        # Coordinates from URL
         latitude = None
         longitude = None
-        try:
-            coords_match = re.search(r'@(-?\d+\.?\d*),(-?\d+\.?\d*)', card_url)
-            if coords_match:
-                latitude = float(coords_match.group(1))
-                longitude = float(coords_match.group(2))
-        except Exception:
-            pass
+        if url_meta.group('lat'):
+            latitude = float(url_meta.group('lat'))
+            longitude = float(url_meta.group('lng'))
         
         result = {
             "place_id": place_id,
@@ -10,15 +10,68 @@ Supports multiple providers:
 import asyncio
 import logging
 import re
+import weakref
+from contextlib import nullcontext
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from string import Template
 
 import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
 
 from config import settings
+from utils.helpers import fill_template
 
 logger = logging.getLogger(__name__)
 
+# Everything except digits and '+' is stripped from phone numbers
+_PHONE_CLEAN_RE = re.compile(r'[^\d+]')
+
+# Placeholders SMS templates support, with the value used when the
+# business has no such field
+PLACEHOLDER_DEFAULTS = {
+    'name': 'Business',
+    'phone': '',
+    'address': '',
+    'website': '',
+    'rating': '',
+    'category': ''
+}
+
+# Connection pool for the shared HTTP session (keep-alive to Twilio/Fast2SMS)
+SMS_MAX_CONNECTIONS = 20
+
+
+@lru_cache(maxsize=4096)
+def _normalize_phone(phone: str) -> Optional[str]:
+    """
+    Normalize a raw phone number to bare digits (memoized: lead lists are
+    often re-sent across campaigns).
+    
+    Args:
+        phone: Raw phone number
+        
+    Returns:
+        Cleaned phone number or None if invalid
+    """
+    # Remove all non-digit characters except +
+    cleaned = _PHONE_CLEAN_RE.sub('', phone)
+    
+    # Remove leading +
+    if cleaned.startswith('+'):
+        cleaned = cleaned[1:]
+    
+    # Basic validation: should be 10-15 digits
+    if len(cleaned) < 10 or len(cleaned) > 15:
+        return None
+    
+    return cleaned
+
+
+def _fast2sms_number(phone: str) -> str:
+    """Drop the 91 country code from a normalized Indian number (Fast2SMS wants 10 digits)"""
+    return phone[2:] if len(phone) == 12 and phone[:2] == '91' else phone
+
 
 class SMSOutreachService:
     """
@@ -50,12 +103,63 @@ class SMSOutreachService:
             'from_number': settings.TWILIO_PHONE_NUMBER,
             'api_url': 'https://api.twilio.com/2010-04-01/Accounts/{sid}/Messages.json'
         }
+        # The account SID never changes, so resolve the Messages URL once
+        self.twilio_config['resolved_url'] = (
+            self.twilio_config['api_url'].format(sid=self.twilio_config['account_sid'])
+            if self.twilio_config['account_sid'] else None
+        )
+        
+        # Credentials are fixed for the service lifetime; build auth/headers once
+        self._twilio_auth = (
+            aiohttp.BasicAuth(self.twilio_config['account_sid'], self.twilio_config['auth_token'])
+            if self.twilio_config['account_sid'] and self.twilio_config['auth_token'] else None
+        )
         
         self.fast2sms_config = {
             'api_key': settings.FAST2SMS_API_KEY,
             'sender_id': settings.FAST2SMS_SENDER_ID or 'FSTSMS',
             'api_url': 'https://www.fast2sms.com/dev/bulkV2'
         }
+        self._fast2sms_headers = {
+            'authorization': self.fast2sms_config['api_key']
+        }
+        # Form fields that are the same for every Fast2SMS message
+        self._fast2sms_body_base = {
+            'route': 'q',  # Quick SMS route
+            'language': 'english',
+            'flash': '0'
+        }
+        
+        # Shared HTTP sessions, created lazily per running event loop (a
+        # session is bound to the loop it was created in). Loops are held
+        # weakly so a finished loop does not outlive its last user.
+        self._sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the running loop's shared HTTP session, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # A session references its own loop, so the weak key alone
+            # cannot drop it; forget sessions of loops that have closed
+            for stale in [old for old in self._sessions if old.is_closed()]:
+                del self._sessions[stale]
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=SMS_MAX_CONNECTIONS,
+                    limit_per_host=SMS_MAX_CONNECTIONS,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                )
+            )
+            self._sessions[loop] = session
+        return session
+    
+    async def close(self) -> None:
+        """Close the running loop's shared HTTP session (call on app shutdown)"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session and not session.closed:
+            await session.close()
     
     def _validate_phone(self, phone: str) -> Optional[str]:
         """
@@ -70,18 +174,23 @@ class SMSOutreachService:
         if not phone:
             return None
         
-        # Remove all non-digit characters except +
-        cleaned = re.sub(r'[^\d+]', '', phone)
-        
-        # Remove leading +
-        if cleaned.startswith('+'):
-            cleaned = cleaned[1:]
-        
-        # Basic validation: should be 10-15 digits
-        if len(cleaned) < 10 or len(cleaned) > 15:
-            return None
+        return _normalize_phone(phone)
+    
+    def _provider_number(self, phone: str, provider: str) -> Optional[str]:
+        """
+        Validate a raw phone number and put it in the form the provider expects.
         
-        return cleaned
+        Args:
+            phone: Raw phone number
+            provider: Provider the number will be sent through
+            
+        Returns:
+            Provider-ready phone number or None if invalid
+        """
+        cleaned_phone = self._validate_phone(phone)
+        if cleaned_phone and provider == 'fast2sms':
+            return _fast2sms_number(cleaned_phone)
+        return cleaned_phone
     
     def _format_message(
         self,
@@ -98,26 +207,8 @@ class SMSOutreachService:
         Returns:
             Formatted message
         """
-        # Create substitution dict with defaults
-        substitutions = {
-            'name': business.get('name', 'Business'),
-            'phone': business.get('phone', ''),
-            'address': business.get('address', ''),
-            'website': business.get('website', ''),
-            'rating': str(business.get('rating', '')),
-            'category': business.get('category', '')
-        }
-        
-        try:
-            # Use safe substitution (won't raise on missing keys)
-            t = Template(template.replace('{', '${'))
-            return t.safe_substitute(substitutions)
-        except Exception:
-            # Fallback: simple replace
-            message = template
-            for key, value in substitutions.items():
-                message = message.replace(f'{{{key}}}', str(value))
-            return message
+        # Unknown {placeholders} (including {reviews}) stay as-is
+        return fill_template(template, business, PLACEHOLDER_DEFAULTS)
     
     async def send_sms_single(
         self,
@@ -139,22 +230,31 @@ class SMSOutreachService:
         provider = provider or self.provider
         
         # Validate phone
-        cleaned_phone = self._validate_phone(phone)
-        if not cleaned_phone:
+        number = self._provider_number(phone, provider)
+        if not number:
             return {
                 'success': False,
                 'phone': phone,
                 'error': 'Invalid phone number'
             }
         
+        return await self._send_to_provider(number, message, provider)
+    
+    async def _send_to_provider(
+        self,
+        number: str,
+        message: str,
+        provider: str
+    ) -> Dict[str, Any]:
+        """Send a message to an already validated, provider-ready number"""
         if provider == 'twilio':
-            return await self._send_twilio(cleaned_phone, message)
+            return await self._send_twilio(number, message)
         elif provider == 'fast2sms':
-            return await self._send_fast2sms(cleaned_phone, message)
+            return await self._send_fast2sms(number, message)
         else:
             return {
                 'success': False,
-                'phone': phone,
+                'phone': number,
                 'error': f'Unknown provider: {provider}'
             }
     
@@ -175,54 +275,50 @@ class SMSOutreachService:
                 'error': 'Twilio not configured'
             }
         
+        url = self.twilio_config['resolved_url']
+        
+        # Ensure phone has country code
+        if not phone.startswith('+'):
+            phone = f'+{phone}'
+        
+        data = {
+            'To': phone,
+            'From': self.twilio_config['from_number'],
+            'Body': message
+        }
+        
+        # Only transport/decoding failures are handled here; anything else
+        # propagates to the caller (send_sms_batch's queue workers catch it per
+        # business, record it as that business's failure and keep going)
         try:
-            url = self.twilio_config['api_url'].format(
-                sid=self.twilio_config['account_sid']
-            )
-            
-            # Ensure phone has country code
-            if not phone.startswith('+'):
-                phone = f'+{phone}'
-            
-            data = {
-                'To': phone,
-                'From': self.twilio_config['from_number'],
-                'Body': message
-            }
-            
-            auth = aiohttp.BasicAuth(
-                self.twilio_config['account_sid'],
-                self.twilio_config['auth_token']
-            )
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    data=data,
-                    auth=auth
-                ) as response:
-                    result = await response.json()
+            session = await self._get_session()
+            async with session.post(
+                url,
+                data=data,
+                auth=self._twilio_auth
+            ) as response:
+                result = orjson.loads(await response.read())
+                
+                if response.status in [200, 201]:
+                    logger.info("SMS sent to %s via Twilio", phone)
+                    return {
+                        'success': True,
+                        'phone': phone,
+                        'message_sid': result.get('sid'),
+                        'provider': 'twilio'
+                    }
+                else:
+                    error_msg = result.get('message', 'Unknown error')
+                    logger.error("Twilio error for %s: %s", phone, error_msg)
+                    return {
+                        'success': False,
+                        'phone': phone,
+                        'error': error_msg,
+                        'provider': 'twilio'
+                    }
                     
-                    if response.status in [200, 201]:
-                        logger.info(f"SMS sent to {phone} via Twilio")
-                        return {
-                            'success': True,
-                            'phone': phone,
-                            'message_sid': result.get('sid'),
-                            'provider': 'twilio'
-                        }
-                    else:
-                        error_msg = result.get('message', 'Unknown error')
-                        logger.error(f"Twilio error for {phone}: {error_msg}")
-                        return {
-                            'success': False,
-                            'phone': phone,
-                            'error': error_msg,
-                            'provider': 'twilio'
-                        }
-                        
-        except Exception as e:
-            logger.error(f"Twilio exception for {phone}: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            logger.error("Twilio exception for %s: %s", phone, e)
             return {
                 'success': False,
                 'phone': phone,
@@ -235,7 +331,7 @@ class SMSOutreachService:
         phone: str,
         message: str
     ) -> Dict[str, Any]:
-        """Send SMS via Fast2SMS (India)"""
+        """Send SMS via Fast2SMS (India); phone is a 10-digit local number"""
         if not self.fast2sms_config['api_key']:
             return {
                 'success': False,
@@ -243,53 +339,43 @@ class SMSOutreachService:
                 'error': 'Fast2SMS not configured'
             }
         
+        data = {
+            **self._fast2sms_body_base,
+            'message': message,
+            'numbers': phone
+        }
+        
+        # Same as Twilio: transport/decoding failures are handled here; anything
+        # else propagates to send_sms_batch's per-business try/except in its workers
         try:
-            # Fast2SMS expects 10-digit Indian numbers
-            # Remove country code if present
-            if phone.startswith('91') and len(phone) == 12:
-                phone = phone[2:]
-            
-            headers = {
-                'authorization': self.fast2sms_config['api_key'],
-                'Content-Type': 'application/json'
-            }
-            
-            data = {
-                'route': 'q',  # Quick SMS route
-                'message': message,
-                'language': 'english',
-                'flash': 0,
-                'numbers': phone
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.fast2sms_config['api_url'],
-                    json=data,
-                    headers=headers
-                ) as response:
-                    result = await response.json()
+            session = await self._get_session()
+            async with session.post(
+                self.fast2sms_config['api_url'],
+                data=data,  # Sent form-urlencoded
+                headers=self._fast2sms_headers
+            ) as response:
+                result = orjson.loads(await response.read())
+                
+                if result.get('return'):
+                    logger.info("SMS sent to %s via Fast2SMS", phone)
+                    return {
+                        'success': True,
+                        'phone': phone,
+                        'request_id': result.get('request_id'),
+                        'provider': 'fast2sms'
+                    }
+                else:
+                    error_msg = result.get('message', 'Unknown error')
+                    logger.error("Fast2SMS error for %s: %s", phone, error_msg)
+                    return {
+                        'success': False,
+                        'phone': phone,
+                        'error': error_msg,
+                        'provider': 'fast2sms'
+                    }
                     
-                    if result.get('return'):
-                        logger.info(f"SMS sent to {phone} via Fast2SMS")
-                        return {
-                            'success': True,
-                            'phone': phone,
-                            'request_id': result.get('request_id'),
-                            'provider': 'fast2sms'
-                        }
-                    else:
-                        error_msg = result.get('message', 'Unknown error')
-                        logger.error(f"Fast2SMS error for {phone}: {error_msg}")
-                        return {
-                            'success': False,
-                            'phone': phone,
-                            'error': error_msg,
-                            'provider': 'fast2sms'
-                        }
-                        
-        except Exception as e:
-            logger.error(f"Fast2SMS exception for {phone}: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            logger.error("Fast2SMS exception for %s: %s", phone, e)
             return {
                 'success': False,
                 'phone': phone,
@@ -312,56 +398,105 @@ class SMSOutreachService:
             results: List of business dictionaries
             message_template: Message template with {variable} placeholders
             provider: Provider to use
-            max_concurrent: Max concurrent sends
-            delay_between: Delay between sends (rate limiting)
+            max_concurrent: Number of send workers (max concurrent sends)
+            delay_between: Spacing between sends of each worker; the batch
+                           rate is capped at max_concurrent/delay_between
+                           messages per second (0 disables)
             
         Returns:
             Summary dictionary with success/failure counts
         """
         provider = provider or self.provider
         
-        sent_results = []
         success_count = 0
         failure_count = 0
         skipped_count = 0
         
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Token bucket for the send rate; only the sends themselves wait on it.
+        # max_concurrent sends per delay_between, i.e. each worker sending once
+        # per delay_between (the defaults allow 10 messages per second)
+        limiter = AsyncLimiter(max_concurrent, delay_between) if delay_between > 0 else None
+        
+        # Businesses are queued with their position so results keep input
+        # order, and with their phone already normalized for the provider
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, business in enumerate(results):
+            phone = business.get('phone')
+            number = self._provider_number(phone, provider) if phone else None
+            queue.put_nowait((index, business, number))
+        sent_results: List[Optional[Dict[str, Any]]] = [None] * len(results)
         
-        async def send_with_rate_limit(business: Dict):
+        async def send_one(business: Dict, number: Optional[str]) -> Dict[str, Any]:
             nonlocal success_count, failure_count, skipped_count
             
-            async with semaphore:
-                phone = business.get('phone')
+            phone = business.get('phone')
+            name = business.get('name')
+            
+            if not phone:
+                skipped_count += 1
+                return {
+                    'business': name,
+                    'success': False,
+                    'error': 'No phone number'
+                }
+            
+            if not number:
+                failure_count += 1
+                return {
+                    'business': name,
+                    'success': False,
+                    'phone': phone,
+                    'error': 'Invalid phone number'
+                }
+            
+            message = self._format_message(message_template, business)
+            
+            async with limiter or nullcontext():
+                result = await self._send_to_provider(number, message, provider)
+            
+            if result['success']:
+                success_count += 1
+            else:
+                failure_count += 1
+            
+            # Add business name to result
+            result['business'] = name
+            
+            return result
+        
+        async def worker() -> None:
+            """Send queued businesses until the queue is drained"""
+            nonlocal failure_count
+            
+            while True:
+                try:
+                    index, business, number = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
                 
-                if not phone:
-                    skipped_count += 1
-                    return {
+                try:
+                    sent_results[index] = await send_one(business, number)
+                except Exception as e:
+                    # An unexpected error fails only its own business
+                    failure_count += 1
+                    logger.error("SMS send failed for %s: %s", business.get('name'), e)
+                    sent_results[index] = {
                         'business': business.get('name'),
+                        'phone': business.get('phone') or '',
                         'success': False,
-                        'error': 'No phone number'
+                        'error': str(e),
+                        'provider': provider
                     }
-                
-                message = self._format_message(message_template, business)
-                result = await self.send_sms_single(phone, message, provider)
-                
-                if result['success']:
-                    success_count += 1
-                else:
-                    failure_count += 1
-                
-                # Add business name to result
-                result['business'] = business.get('name')
-                
-                # Rate limiting delay
-                await asyncio.sleep(delay_between)
-                
-                return result
         
-        # Create tasks for all businesses
-        tasks = [send_with_rate_limit(business) for business in results]
+        # Open the shared session once up front; every send reuses its connections
+        await self._get_session()
         
-        # Execute all tasks
-        sent_results = await asyncio.gather(*tasks)
+        # max_concurrent workers drain the queue (no coroutine per business)
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(max_concurrent, len(results)))
+        ]
+        await asyncio.gather(*workers)
         
         summary = {
             'total': len(results),
@@ -373,8 +508,8 @@ class SMSOutreachService:
         }
         
         logger.info(
-            f"SMS batch complete: {success_count} sent, "
-            f"{failure_count} failed, {skipped_count} skipped"
+            "SMS batch complete: %d sent, %d failed, %d skipped",
+            success_count, failure_count, skipped_count
         )
         
         return summary
@@ -398,5 +533,17 @@ class SMSOutreachService:
         }
 
 
-# Global instance for shared use
-sms_service = SMSOutreachService()
+# Lazy singleton instance
+_sms_service: Optional[SMSOutreachService] = None
+
+
+def get_sms_service() -> SMSOutreachService:
+    """Get singleton SMS service instance"""
+    global _sms_service
+    if _sms_service is None:
+        _sms_service = SMSOutreachService()
+    return _sms_service
+
+
+# For convenience
+sms_service = get_sms_service()
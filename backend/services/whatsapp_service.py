@@ -12,15 +12,64 @@ Features:
 """
 
 import os
+import re
 import asyncio
 import logging
+import weakref
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+
+from utils.helpers import fill_template
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 support (optional - needs the h2 package, i.e. httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+# WhatsApp expects bare digits: country code + number, no '+', spaces or dashes
+_DIGITS_RE = re.compile(r'\D')
+
+# Placeholders supported by personalize_message, with the value used when
+# the lead has no such field
+PLACEHOLDER_DEFAULTS = {
+    'name': 'there',
+    'phone': '',
+    'address': '',
+    'website': '',
+    'rating': '',
+    'category': '',
+    'reviews': '',
+}
+
+# Connection pool for the shared Graph API client. Over HTTP/2 concurrent
+# sends are multiplexed on a few connections, so the pool can stay small.
+WHATSAPP_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+
+# Request timeouts, built once instead of from a float on every call
+SEND_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+LOOKUP_TIMEOUT = httpx.Timeout(15.0, connect=10.0)
+
+# Fields shared by every outgoing message payload
+_MESSAGE_PAYLOAD_BASE = {
+    'messaging_product': 'whatsapp',
+    'recipient_type': 'individual'
+}
+
+
+@lru_cache(maxsize=4096)
+def _clean_phone(to: str) -> str:
+    """Strip a phone number down to digits (memoized across sends)."""
+    return _DIGITS_RE.sub('', to)
+
 
 class WhatsAppService:
     """
@@ -48,6 +97,15 @@ class WhatsAppService:
         # Rate limiting
         self.messages_per_second = 10  # WhatsApp rate limit
         self.last_message_time = datetime.min
+        # Service-wide limiters, one per running event loop (a limiter's
+        # waiters belong to the loop that awaits it)
+        self._limiters: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        
+        # Messages endpoint per phone number ID
+        self._api_urls: Dict[str, str] = {}
+        
+        # Request headers for the shared account; user tokens get their own
+        self._shared_headers = self._build_headers(self.shared_access_token)
         
         self._initialized = bool(self.shared_phone_number_id and self.shared_access_token)
         
@@ -55,10 +113,64 @@ class WhatsAppService:
             logger.warning("⚠️ WhatsApp shared account not configured. Set WHATSAPP_PHONE_NUMBER_ID and WHATSAPP_ACCESS_TOKEN")
         else:
             logger.info("✅ WhatsApp service initialized with shared account")
+        
+        # Shared HTTP clients, created lazily per running event loop (a
+        # client's connection pool is bound to the loop it was used in).
+        # Loops are held weakly so a finished loop does not outlive its last user.
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the running loop's shared HTTP client, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            # Open connections reference their loop, so the weak key alone
+            # cannot drop them; forget clients of loops that have closed
+            for stale in [old for old in self._clients if old.is_closed()]:
+                del self._clients[stale]
+            client = httpx.AsyncClient(
+                http2=HTTP2_ENABLED,
+                limits=WHATSAPP_HTTP_LIMITS,
+                timeout=SEND_TIMEOUT
+            )
+            self._clients[loop] = client
+        return client
+
+    def _get_limiter(self) -> AsyncLimiter:
+        """Get the running loop's service-wide rate limiter, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        limiter = self._limiters.get(loop)
+        if limiter is None:
+            limiter = self._limiters[loop] = AsyncLimiter(self.messages_per_second, 1)
+        return limiter
+
+    async def close(self) -> None:
+        """Close the running loop's shared HTTP client (call on app shutdown)."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client and not client.is_closed:
+            await client.aclose()
+
+    @staticmethod
+    def _build_headers(token: Optional[str]) -> Dict[str, str]:
+        """Build JSON request headers for an access token."""
+        return {
+            'Authorization': f'Bearer {token}',
+            'Content-Type': 'application/json'
+        }
+
+    def _get_headers(self, token: str) -> Dict[str, str]:
+        """Get request headers, reusing the prebuilt ones for the shared token."""
+        if token == self.shared_access_token:
+            return self._shared_headers
+        return self._build_headers(token)
 
     def _get_api_url(self, phone_number_id: str) -> str:
         """Get API URL for sending messages."""
-        return f"{self.BASE_URL}/{self.API_VERSION}/{phone_number_id}/messages"
+        url = self._api_urls.get(phone_number_id)
+        if url is None:
+            url = f"{self.BASE_URL}/{self.API_VERSION}/{phone_number_id}/messages"
+            self._api_urls[phone_number_id] = url
+        return url
 
     async def send_message(
         self,
@@ -91,7 +203,7 @@ class WhatsAppService:
             }
 
         # Clean phone number (remove +, spaces, dashes)
-        clean_phone = ''.join(filter(str.isdigit, to))
+        clean_phone = _clean_phone(to)
         
         if len(clean_phone) < 10:
             return {
@@ -101,14 +213,10 @@ class WhatsAppService:
 
         url = self._get_api_url(phone_id)
 
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
+        headers = self._get_headers(token)
 
         payload = {
-            'messaging_product': 'whatsapp',
-            'recipient_type': 'individual',
+            **_MESSAGE_PAYLOAD_BASE,
             'to': clean_phone,
             'type': 'text',
             'text': {
@@ -118,37 +226,38 @@ class WhatsAppService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0
-                )
-
-                result = response.json()
-
-                if response.status_code == 200:
-                    logger.info(f"✅ WhatsApp sent to {clean_phone[-4:]}")
-                    return {
-                        'success': True,
-                        'data': result,
-                        'message_id': result.get('messages', [{}])[0].get('id')
-                    }
-                else:
-                    error_msg = result.get('error', {}).get('message', 'Unknown error')
-                    logger.error(f"❌ WhatsApp failed to {clean_phone[-4:]}: {error_msg}")
-                    return {
-                        'success': False,
-                        'error': error_msg,
-                        'error_code': result.get('error', {}).get('code')
-                    }
-
-        except httpx.TimeoutException:
-            logger.error(f"Timeout sending to {clean_phone[-4:]}")
+            client = self._get_client()
+            response = await client.post(
+                url,
+                content=orjson.dumps(payload),
+                headers=headers,
+                timeout=SEND_TIMEOUT
+            )
+
+            result = orjson.loads(response.content)
+
+            if response.status_code == 200:
+                logger.info("✅ WhatsApp sent to %s", clean_phone[-4:])
+                return {
+                    'success': True,
+                    'data': result,
+                    # A 200 can come back with an empty "messages" list
+                    'message_id': (result.get('messages') or [{}])[0].get('id')
+                }
+            else:
+                error_msg = result.get('error', {}).get('message', 'Unknown error')
+                logger.error("❌ WhatsApp failed to %s: %s", clean_phone[-4:], error_msg)
+                return {
+                    'success': False,
+                    'error': error_msg,
+                    'error_code': result.get('error', {}).get('code')
+                }
+
+        except (httpx.TimeoutException, asyncio.TimeoutError):
+            logger.error("Timeout sending to %s", clean_phone[-4:])
             return {'success': False, 'error': 'Request timeout'}
-        except Exception as e:
-            logger.error(f"Error sending to {clean_phone[-4:]}: {e}")
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error("Error sending to %s: %s", clean_phone[-4:], e)
             return {'success': False, 'error': str(e)}
 
     async def send_bulk_messages(
@@ -156,17 +265,23 @@ class WhatsAppService:
         recipients: List[Dict[str, str]],
         phone_number_id: Optional[str] = None,
         access_token: Optional[str] = None,
-        delay_seconds: float = 0.1
+        delay_seconds: float = 0.1,
+        max_concurrent: int = 10
     ) -> Dict[str, Any]:
         """
         Send bulk WhatsApp messages with personalization.
+        
+        Sends run concurrently (at most max_concurrent in flight) and are paced
+        by the service-wide token bucket (messages_per_second), plus
+        delay_seconds spacing if given.
 
         Args:
             recipients: List of dicts with 'phone' and 'message' keys
                 Example: [{"phone": "919876543210", "message": "Hi John!"}]
             phone_number_id: User's phone number ID (optional)
             access_token: User's access token (optional)
-            delay_seconds: Delay between messages (rate limiting)
+            delay_seconds: Minimum spacing between messages (rate limiting)
+            max_concurrent: Maximum requests in flight at once
 
         Returns:
             Summary dict with total, success, failed counts and errors
@@ -188,24 +303,57 @@ class WhatsAppService:
             'message_ids': []
         }
 
-        for i, recipient in enumerate(recipients):
+        # Per-batch spacing on top of the service-wide rate limit
+        pace = AsyncLimiter(1, delay_seconds) if delay_seconds > 0 else None
+        limiter = self._get_limiter()
+        semaphore = asyncio.Semaphore(max_concurrent)
+        sent = 0
+        progress_enabled = logger.isEnabledFor(logging.INFO)
+
+        async def _send_one(phone: str, message: str) -> Dict[str, Any]:
+            nonlocal sent
+            async with semaphore:
+                if pace:
+                    await pace.acquire()
+                async with limiter:
+                    result = await self.send_message(
+                        to=phone,
+                        message=message,
+                        phone_number_id=phone_number_id,
+                        access_token=access_token
+                    )
+
+            # Progress logging
+            sent += 1
+            if progress_enabled and sent % 50 == 0:
+                logger.info("📤 Bulk progress: %d/%d", sent, len(recipients))
+
+            return result
+
+        # Error entries by recipient position, so the errors list keeps input
+        # order no matter when each send finishes
+        errors: List[Optional[Dict[str, str]]] = [None] * len(recipients)
+        pending = []
+        for index, recipient in enumerate(recipients):
             phone = recipient.get('phone')
             message = recipient.get('message')
 
             if not phone or not message:
                 results['failed'] += 1
-                results['errors'].append({
+                errors[index] = {
                     'phone': phone or 'N/A',
                     'error': 'Missing phone or message'
-                })
+                }
                 continue
 
-            result = await self.send_message(
-                to=phone,
-                message=message,
-                phone_number_id=phone_number_id,
-                access_token=access_token
-            )
+            pending.append((index, phone, _send_one(phone, message)))
+
+        # A failing send must not abort the rest of the batch
+        outcomes = await asyncio.gather(*(coro for _, _, coro in pending), return_exceptions=True)
+
+        for (index, phone, _), result in zip(pending, outcomes):
+            if isinstance(result, Exception):
+                result = {'success': False, 'error': str(result)}
 
             if result['success']:
                 results['success'] += 1
@@ -213,22 +361,16 @@ class WhatsAppService:
                     results['message_ids'].append(result['message_id'])
             else:
                 results['failed'] += 1
-                results['errors'].append({
+                errors[index] = {
                     'phone': phone[-4:] if phone else 'N/A',  # Last 4 digits for privacy
                     'error': result.get('error', 'Unknown error')
-                })
-
-            # Rate limiting delay
-            if delay_seconds > 0 and i < len(recipients) - 1:
-                await asyncio.sleep(delay_seconds)
+                }
 
-            # Progress logging
-            if (i + 1) % 50 == 0:
-                logger.info(f"📤 Bulk progress: {i + 1}/{len(recipients)}")
+        results['errors'] = [error for error in errors if error]
 
         logger.info(
-            f"📊 Bulk send complete: {results['success']}/{results['total']} successful, "
-            f"{results['failed']} failed"
+            "📊 Bulk send complete: %d/%d successful, %d failed",
+            results['success'], results['total'], results['failed']
         )
         
         return results
@@ -272,13 +414,10 @@ class WhatsAppService:
                 'error': 'WhatsApp credentials not configured'
             }
 
-        clean_phone = ''.join(filter(str.isdigit, to))
+        clean_phone = _clean_phone(to)
         url = self._get_api_url(phone_id)
 
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
+        headers = self._get_headers(token)
 
         # Build template components
         components = []
@@ -305,8 +444,7 @@ class WhatsAppService:
                 })
 
         payload = {
-            'messaging_product': 'whatsapp',
-            'recipient_type': 'individual',
+            **_MESSAGE_PAYLOAD_BASE,
             'to': clean_phone,
             'type': 'template',
             'template': {
@@ -321,26 +459,26 @@ class WhatsAppService:
             payload['template']['components'] = components
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0
-                )
-
-                result = response.json()
-
-                if response.status_code == 200:
-                    logger.info(f"✅ Template '{template_name}' sent to {clean_phone[-4:]}")
-                    return {'success': True, 'data': result}
-                else:
-                    error_msg = result.get('error', {}).get('message', 'Unknown error')
-                    logger.error(f"❌ Template failed: {error_msg}")
-                    return {'success': False, 'error': error_msg}
+            client = self._get_client()
+            response = await client.post(
+                url,
+                content=orjson.dumps(payload),
+                headers=headers,
+                timeout=SEND_TIMEOUT
+            )
+
+            result = orjson.loads(response.content)
+
+            if response.status_code == 200:
+                logger.info("✅ Template '%s' sent to %s", template_name, clean_phone[-4:])
+                return {'success': True, 'data': result}
+            else:
+                error_msg = result.get('error', {}).get('message', 'Unknown error')
+                logger.error("❌ Template failed: %s", error_msg)
+                return {'success': False, 'error': error_msg}
 
         except Exception as e:
-            logger.error(f"Error sending template: {e}")
+            logger.error("Error sending template: %s", e)
             return {'success': False, 'error': str(e)}
 
     async def verify_credentials(
@@ -365,22 +503,22 @@ class WhatsAppService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, timeout=15.0)
-                result = response.json()
-
-                if response.status_code == 200:
-                    return {
-                        'valid': True,
-                        'phone_number': result.get('display_phone_number'),
-                        'verified_name': result.get('verified_name'),
-                        'quality_rating': result.get('quality_rating')
-                    }
-                else:
-                    return {
-                        'valid': False,
-                        'error': result.get('error', {}).get('message', 'Invalid credentials')
-                    }
+            client = self._get_client()
+            response = await client.get(url, headers=headers, timeout=LOOKUP_TIMEOUT)
+            result = orjson.loads(response.content)
+
+            if response.status_code == 200:
+                return {
+                    'valid': True,
+                    'phone_number': result.get('display_phone_number'),
+                    'verified_name': result.get('verified_name'),
+                    'quality_rating': result.get('quality_rating')
+                }
+            else:
+                return {
+                    'valid': False,
+                    'error': result.get('error', {}).get('message', 'Invalid credentials')
+                }
 
         except Exception as e:
             return {'valid': False, 'error': str(e)}
@@ -416,29 +554,29 @@ class WhatsAppService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, timeout=15.0)
-                result = response.json()
-
-                if response.status_code == 200:
-                    templates = result.get('data', [])
-                    return {
-                        'success': True,
-                        'templates': [
-                            {
-                                'name': t.get('name'),
-                                'status': t.get('status'),
-                                'category': t.get('category'),
-                                'language': t.get('language')
-                            }
-                            for t in templates
-                        ]
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'error': result.get('error', {}).get('message', 'Failed to fetch templates')
-                    }
+            client = self._get_client()
+            response = await client.get(url, headers=headers, timeout=LOOKUP_TIMEOUT)
+            result = orjson.loads(response.content)
+
+            if response.status_code == 200:
+                templates = result.get('data', [])
+                return {
+                    'success': True,
+                    'templates': [
+                        {
+                            'name': t.get('name'),
+                            'status': t.get('status'),
+                            'category': t.get('category'),
+                            'language': t.get('language')
+                        }
+                        for t in templates
+                    ]
+                }
+            else:
+                return {
+                    'success': False,
+                    'error': result.get('error', {}).get('message', 'Failed to fetch templates')
+                }
 
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -467,23 +605,20 @@ class WhatsAppService:
         Returns:
             Personalized message string
         """
-        message = template
-        
-        replacements = {
-            '{name}': lead.get('name', 'there'),
-            '{phone}': lead.get('phone', ''),
-            '{address}': lead.get('address', ''),
-            '{website}': lead.get('website', ''),
-            '{rating}': str(lead.get('rating', '')),
-            '{category}': lead.get('category', ''),
-            '{reviews}': str(lead.get('reviews_count', '')),
-        }
-        
-        for placeholder, value in replacements.items():
-            message = message.replace(placeholder, value or '')
-        
-        return message.strip()
+        return fill_template(template, lead, PLACEHOLDER_DEFAULTS).strip()
+
+
+# Lazy singleton instance
+_whatsapp_service: Optional[WhatsAppService] = None
+
+
+def get_whatsapp_service() -> WhatsAppService:
+    """Get singleton WhatsApp service instance."""
+    global _whatsapp_service
+    if _whatsapp_service is None:
+        _whatsapp_service = WhatsAppService()
+    return _whatsapp_service
 
 
-# Singleton instance
-whatsapp_service = WhatsAppService()
+# For convenience
+whatsapp_service = get_whatsapp_service()
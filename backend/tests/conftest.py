@@ -0,0 +1,13 @@
+"""
+Shared pytest setup for the Scrappy backend tests.
+
+Run from the backend folder:
+    pip install -r requirements-dev.txt
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+# Make backend modules (config, services, utils, ...) importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,66 @@
+"""
+Tests for utils.helpers.
+"""
+
+from collections import defaultdict
+
+from utils.helpers import _PHONE_KEEP, clean_phone_number, fill_template, safe_get_nested
+
+
+def test_safe_get_nested_dicts():
+    assert safe_get_nested({'a': {'b': 1}}, 'a', 'b') == 1
+    assert safe_get_nested({'a': {'b': {'c': 2}}}, 'a', 'b', 'c') == 2
+    assert safe_get_nested({'a': {}}, 'a', 'b', 'c', default=0) == 0
+    assert safe_get_nested({'a': {}}, 'a', 'b', default=7) == 7
+
+
+def test_safe_get_nested_keeps_stored_none():
+    assert safe_get_nested({'a': {'b': None}}, 'a', 'b', default=3) is None
+    assert safe_get_nested({'a': None}, 'a', 'b', default=3) == 3
+
+
+def test_safe_get_nested_sequences():
+    assert safe_get_nested({'a': [1, 2]}, 'a', 1) == 2
+    assert safe_get_nested([{'x': 1}], 0, 'x') == 1
+    assert safe_get_nested({'a': [1]}, 'a', 5, default='d') == 'd'
+
+
+def test_safe_get_nested_unhashable_key_returns_default():
+    # Regression: the dict.get() fast path raised TypeError for these
+    assert safe_get_nested({'a': 1}, ['x']) is None
+    assert safe_get_nested({'a': 1}, ['x'], default=0) == 0
+    assert safe_get_nested({'a': {'b': 1}}, ['a'], 'b', default=0) == 0
+    assert safe_get_nested({'a': {'b': 1}}, 'a', ['b'], default=0) == 0
+    assert safe_get_nested({'a': {'b': {}}}, 'a', 'b', {'c'}, default=0) == 0
+
+
+def test_safe_get_nested_dict_subclass_uses_indexing():
+    data = defaultdict(dict)
+    assert safe_get_nested(data, 'a', 'b', default=0) == 0
+    assert 'a' in data
+
+
+def test_clean_phone_number():
+    assert clean_phone_number("+91 987-654-3210") == "+919876543210"
+    assert clean_phone_number("(987) 654-3210") == "9876543210"
+    assert clean_phone_number("Tel: +1 (555) 123-4567") == "+15551234567"
+    assert clean_phone_number("Mobile: 123") is None
+    # Unicode digits are kept, as with the old [^\d+] regex
+    assert clean_phone_number("+९१ ९८७६५४३२१०") == "+९१९८७६५४३२१०"
+
+
+def test_phone_char_table_does_not_grow():
+    size = len(_PHONE_KEEP)
+    clean_phone_number("☎ +44 20 7946 0958 ✓ " + "".join(map(chr, range(0x4E00, 0x4F00))))
+    assert len(_PHONE_KEEP) == size
+
+
+def test_fill_template():
+    defaults = {'name': 'there', 'rating': '', 'reviews': ''}
+    data = {'name': 'Cafe', 'rating': None, 'reviews_count': 12}
+
+    assert fill_template("Hi {name}, {name}!", data, defaults) == "Hi Cafe, Cafe!"
+    assert fill_template("{rating}/{reviews}", data, defaults) == "/12"
+    assert fill_template("Hi {name}", {}, defaults) == "Hi there"
+    # Placeholders without a default (or unknown ones) are left alone
+    assert fill_template("{phone} {other}", data, defaults) == "{phone} {other}"
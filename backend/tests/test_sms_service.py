@@ -0,0 +1,76 @@
+"""
+Tests for SMSOutreachService batch sending.
+"""
+
+import asyncio
+import time
+
+from services.sms_service import SMSOutreachService
+
+
+def _run_batch(count: int, **kwargs) -> float:
+    """Send a batch of `count` businesses with a fake provider; return seconds taken."""
+    service = SMSOutreachService(provider="fast2sms")
+
+    async def fake_send(number, message, provider):
+        return {'success': True, 'phone': number, 'provider': provider}
+
+    service._send_to_provider = fake_send
+    businesses = [{'name': f'Biz {i}', 'phone': f'98765432{i:02d}'} for i in range(count)]
+
+    async def run() -> float:
+        try:
+            start = time.perf_counter()
+            summary = await service.send_sms_batch(businesses, "Hi {name}", **kwargs)
+            elapsed = time.perf_counter() - start
+        finally:
+            await service.close()
+        assert summary['success'] == count
+        return elapsed
+
+    return asyncio.run(run())
+
+
+def test_send_sms_batch_default_rate_is_ten_per_second():
+    """Defaults (max_concurrent=5, delay_between=0.5) allow ~10 messages/second."""
+    # 5 go out at once, the other 20 at 10/s: ~2s. One message per
+    # delay_between for the whole batch would take ~12s.
+    elapsed = _run_batch(25)
+
+    assert elapsed < 3.0
+    # ...and the batch is still rate limited
+    assert elapsed > 1.5
+
+
+def test_send_sms_batch_without_delay_is_unthrottled():
+    elapsed = _run_batch(25, delay_between=0)
+
+    assert elapsed < 0.5
+
+
+def test_send_sms_batch_normalizes_numbers_for_the_provider():
+    service = SMSOutreachService(provider="fast2sms")
+    sent = []
+
+    async def fake_send(number, message, provider):
+        sent.append(number)
+        return {'success': True, 'phone': number, 'provider': provider}
+
+    service._send_to_provider = fake_send
+    businesses = [
+        {'name': 'A', 'phone': '+91 98765-43210'},
+        {'name': 'B', 'phone': '123'},
+        {'name': 'C', 'phone': None},
+    ]
+
+    async def run():
+        try:
+            return await service.send_sms_batch(businesses, "Hi {name}", delay_between=0)
+        finally:
+            await service.close()
+
+    summary = asyncio.run(run())
+
+    assert sent == ['9876543210']
+    assert (summary['success'], summary['failed'], summary['skipped']) == (1, 1, 1)
+    assert summary['results'][1]['error'] == 'Invalid phone number'
@@ -0,0 +1,85 @@
+"""
+Tests for WhatsAppService sending.
+"""
+
+import asyncio
+
+import httpx
+
+from services.whatsapp_service import WhatsAppService
+
+
+def test_send_bulk_messages_errors_keep_input_order():
+    service = WhatsAppService()
+
+    async def fake_send(to, message, phone_number_id=None, access_token=None):
+        # The first recipient finishes last
+        await asyncio.sleep(0.05 if to.endswith('1') else 0)
+        if to.endswith('3'):
+            raise RuntimeError('boom')
+        return {'success': to.endswith('0'), 'error': 'rejected', 'message_id': 'wamid.0'}
+
+    service.send_message = fake_send
+    recipients = [
+        {'phone': '9990000001', 'message': 'Hi'},
+        {'phone': None, 'message': 'Hi'},
+        {'phone': '9990000003', 'message': 'Hi'},
+        {'phone': '9990000000', 'message': 'Hi'},
+        {'phone': '9990000004', 'message': None},
+    ]
+
+    results = asyncio.run(service.send_bulk_messages(recipients, delay_seconds=0))
+
+    assert results['success'] == 1
+    assert results['failed'] == 4
+    assert results['message_ids'] == ['wamid.0']
+    assert results['errors'] == [
+        {'phone': '0001', 'error': 'rejected'},
+        {'phone': 'N/A', 'error': 'Missing phone or message'},
+        {'phone': '0003', 'error': 'boom'},
+        {'phone': '9990000004', 'error': 'Missing phone or message'},
+    ]
+
+
+def _send_with_response(status_code: int, body: dict) -> dict:
+    """Run send_message against a canned Graph API response."""
+    service = WhatsAppService()
+    transport = httpx.MockTransport(lambda request: httpx.Response(status_code, json=body))
+
+    async def run() -> dict:
+        async with httpx.AsyncClient(transport=transport) as client:
+            service._get_client = lambda: client
+            return await service.send_message(
+                '919876543210', 'Hi', phone_number_id='123', access_token='token'
+            )
+
+    return asyncio.run(run())
+
+
+def test_send_message_returns_message_id():
+    result = _send_with_response(200, {'messages': [{'id': 'wamid.1'}]})
+
+    assert result['success'] is True
+    assert result['message_id'] == 'wamid.1'
+
+
+def test_send_message_tolerates_empty_messages_list():
+    # Regression: `"messages": []` raised IndexError out of send_message
+    result = _send_with_response(200, {'messages': []})
+
+    assert result['success'] is True
+    assert result['message_id'] is None
+
+
+def test_rate_limiter_is_per_event_loop():
+    # A limiter's waiters belong to one loop, so each loop gets its own
+    service = WhatsAppService()
+
+    async def limiters():
+        return service._get_limiter(), service._get_limiter()
+
+    first, same = asyncio.run(limiters())
+    second, _ = asyncio.run(limiters())
+
+    assert first is same
+    assert first is not second
@@ -2,8 +2,10 @@
 Backfill script to update existing UserPlace records with query_normalized values.
 
 This script:
-1. Reads all UserPlace records where query_normalized is NULL
-2. Normalizes the search_query using QueryNormalizer
+1. Reads (id, query_hash) of UserPlace records where query_normalized
+   is NULL, in id-ordered keyset batches
+2. Looks up one ScrapeSession query per distinct query_hash in the batch
+   and normalizes it using QueryNormalizer
 3. Updates the record with the normalized query
 
 Run from backend folder:
@@ -13,23 +15,59 @@ Run from backend folder:
 import asyncio
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, bindparam
 from sqlalchemy.orm import Session
 from database import engine, SessionLocal
-from models.scrape_history import UserPlace
-from sqlalchemy import text
-from services.query_normalizer import QueryNormalizer
-
-
-def backfill_normalized_queries():
-    """Backfill query_normalized for existing UserPlace records."""
-    normalizer = QueryNormalizer()
-    
-    with SessionLocal() as db:
+from models.scrape_history import UserPlace, ScrapeSession
+from services.query_normalizer import QueryNormalizer, normalize_query
+
+
+# Shared by the backfill and --dry-run
+_NORMALIZER = QueryNormalizer()
+
+# Rows per batch. Larger batches amortize the commit (WAL flush) per batch;
+# override with --batch-size
+BACKFILL_BATCH_SIZE = 2000
+
+# With --workers, a batch's new distinct queries are normalized in worker
+# processes, but only when there are enough of them to outweigh the IPC cost
+PARALLEL_NORMALIZE_MIN_QUERIES = 512
+PARALLEL_NORMALIZE_CHUNKSIZE = 256
+
+# One session query per query_hash, for a whole list of hashes. Built once:
+# the expanding bind keeps the statement (and its compiled-SQL cache entry)
+# the same for every batch and for --dry-run
+SESSION_QUERY_LOOKUP_SQL = (
+    select(ScrapeSession.query_hash, ScrapeSession.query)
+    .where(ScrapeSession.query_hash.in_(bindparam('hashes', expanding=True)))
+    .distinct(ScrapeSession.query_hash)
+)
+
+# One UPDATE statement, executed for a whole batch of rows at once
+BULK_UPDATE_SQL = (
+    update(UserPlace.__table__)
+    .where(UserPlace.__table__.c.id == bindparam('b_id'))
+    .values(query_normalized=bindparam('b_norm'))
+)
+
+
+def backfill_normalized_queries(batch_size: int = BACKFILL_BATCH_SIZE, workers: int = 0):
+    """
+    Backfill query_normalized for existing UserPlace records.
+
+    Args:
+        batch_size: Rows read, updated and committed per batch
+        workers: Processes used to normalize queries (0/1 = in-process)
+    """
+    # Plain Core connection: the backfill only runs Core statements, so the
+    # ORM Session's identity map and flush/dirty checks are pure overhead
+    with engine.connect() as db:
         # Count records needing update
         count_query = select(func.count(UserPlace.id)).where(
             UserPlace.query_normalized.is_(None)
@@ -41,48 +79,75 @@ def backfill_normalized_queries():
             print("✅ All records already have query_normalized set!")
             return
         
-        # Fetch records in batches
-        batch_size = 500
+        # Process (id, query_hash) rows in batches
         updated = 0
-
-        while True:
-            query = select(UserPlace).where(
-                UserPlace.query_normalized.is_(None)
-            ).limit(batch_size)
-
-            results = db.execute(query).scalars().all()
-            if not results:
-                break
-
-            for place in results:
-                normalized_value = None
-
-                # Prefer using an associated ScrapeSession if query_hash is present
-                if place.query_hash:
-                    # Use raw SQL to avoid relying on optional model columns
-                    row = db.execute(
-                        text("SELECT query FROM scrape_sessions WHERE query_hash = :qhash LIMIT 1"),
-                        {"qhash": place.query_hash}
-                    ).fetchone()
-
-                    if row and row[0]:
-                        normalized_value = normalizer.normalize(row[0])
-
-                # If we still don't have a normalized value, skip (can't infer safely)
-                if normalized_value:
-                    place.query_normalized = normalized_value
-                    updated += 1
-
-            db.commit()
-            print(f"📝 Updated {updated}/{total} records...")
+        last_id = 0  # Keyset cursor: each batch resumes after the last id seen
+        # query_hash -> normalized query (None if no ScrapeSession has that hash)
+        normalized_by_hash = {}
+        # Sessions with different hashes can share a query; normalize each once
+        normalized_cache = {}
+
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+        with pool:
+            while True:
+                # Each batch is its own short transaction (read, update, commit),
+                # so no snapshot is held open across the backfill
+                results = db.execute(
+                    select(UserPlace.id, UserPlace.query_hash)
+                    .where(
+                        UserPlace.query_normalized.is_(None),
+                        UserPlace.query_hash.isnot(None),
+                        UserPlace.id > last_id
+                    )
+                    .order_by(UserPlace.id)
+                    .limit(batch_size)
+                ).all()
+                if not results:
+                    break
+                last_id = results[-1][0]  # Ordered by id, so the last row has the max
+
+                # Many places share a query_hash: fetch one session query per hash
+                # not seen yet, for the whole batch in a single query
+                new_hashes = {qhash for _, qhash in results} - normalized_by_hash.keys()
+                if new_hashes:
+                    hash_to_query = dict(db.execute(
+                        SESSION_QUERY_LOOKUP_SQL, {'hashes': list(new_hashes)}
+                    ).all())
+
+                    pending = list({
+                        session_query for session_query in hash_to_query.values()
+                        if session_query and session_query not in normalized_cache
+                    })
+                    if workers > 1 and len(pending) >= PARALLEL_NORMALIZE_MIN_QUERIES:
+                        normalized_cache.update(zip(pending, pool.map(
+                            normalize_query, pending, chunksize=PARALLEL_NORMALIZE_CHUNKSIZE
+                        )))
+                    else:
+                        for session_query in pending:
+                            normalized_cache[session_query] = _NORMALIZER.normalize(session_query)
+
+                    for qhash in new_hashes:
+                        # No session (or empty result): can't infer safely, skip
+                        normalized_by_hash[qhash] = normalized_cache.get(hash_to_query.get(qhash)) or None
+
+                params = [
+                    {'b_id': place_id, 'b_norm': normalized_by_hash[qhash]}
+                    for place_id, qhash in results
+                    if normalized_by_hash[qhash]
+                ]
+
+                batch_updated = len(params)
+                if params:
+                    db.execute(BULK_UPDATE_SQL, params)
+                db.commit()
+                updated += batch_updated
+                print(f"📝 Updated {updated}/{total} records...")
 
         print(f"✅ Backfill complete! Updated {updated} records.")
 
 
 def show_stats():
     """Show statistics about query_normalized values."""
-    normalizer = QueryNormalizer()
-    
     with SessionLocal() as db:
         # Count total
         total = db.execute(select(func.count(UserPlace.id))).scalar()
@@ -140,15 +205,14 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Backfill normalized queries for UserPlace records")
     parser.add_argument("--stats", action="store_true", help="Show statistics only")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be updated without making changes")
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE, help="Rows updated per batch/commit")
+    parser.add_argument("--workers", type=int, default=0, help="Processes for normalizing queries (0 = in-process)")
     
     args = parser.parse_args()
     
     if args.stats:
         show_stats()
     elif args.dry_run:
-        from services.query_normalizer import QueryNormalizer
-        normalizer = QueryNormalizer()
-        
         with SessionLocal() as db:
             # Show sample of query_hash values and what we'd infer
             query = select(UserPlace.query_hash).where(
@@ -157,23 +221,27 @@ if __name__ == "__main__":
 
             results = db.execute(query).scalars().all()
 
+            # One lookup for all sampled hashes instead of one query per hash
+            hashes = [qhash for qhash in results if qhash]
+            hash_to_query = {}
+            if hashes:
+                hash_to_query = dict(db.execute(
+                    SESSION_QUERY_LOOKUP_SQL, {'hashes': hashes}
+                ).all())
+
             print("🔍 Sample normalizations (dry run):")
             for qhash in results:
                 if not qhash:
                     print("  <no query_hash> -> skipped")
                     continue
 
-                row = db.execute(
-                    text("SELECT query FROM scrape_sessions WHERE query_hash = :qhash LIMIT 1"),
-                    {"qhash": qhash}
-                ).fetchone()
-
-                if row and row[0]:
-                    print(f"  '{qhash}' -> normalized(session.query): '{normalizer.normalize(row[0])}'")
+                session_query = hash_to_query.get(qhash)
+                if session_query:
+                    print(f"  '{qhash}' -> normalized(session.query): '{_NORMALIZER.normalize(session_query)}'")
                 else:
                     print(f"  '{qhash}' -> no matching ScrapeSession found; would skip")
     else:
         print("🚀 Starting backfill...")
-        backfill_normalized_queries()
+        backfill_normalized_queries(batch_size=args.batch_size, workers=args.workers)
         print("\n📊 Final stats:")
         show_stats()
@@ -5,13 +5,75 @@ Common utility functions used across the application.
 """
 
 import re
+import time
 import logging
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Mapping, Sequence, Tuple
 from datetime import datetime
 import json
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns (these helpers run once per business row on export)
+_RE_REDIRECT_URL = re.compile(r'url=([^&]+)')
+_RE_NUMBER = re.compile(r'(\d+\.?\d*)')
+_RE_INTEGER = re.compile(r'(\d+)')
+# Both Maps coordinate forms in one pass: @lat,lng or !3dlat!4dlng
+_RE_COORDS = re.compile(
+    r'@(?P<lat1>-?\d+\.?\d*),(?P<lng1>-?\d+\.?\d*)'
+    r'|!3d(?P<lat2>-?\d+\.?\d*)!4d(?P<lng2>-?\d+\.?\d*)'
+)
+_RE_FILENAME_BAD = re.compile(r'[<>:"/\\|?*]')
+
+# Outreach message placeholders: placeholder -> business/lead key.
+# Each service supplies its own defaults (and so which placeholders it fills).
+TEMPLATE_PLACEHOLDERS = {
+    'name': 'name',
+    'phone': 'phone',
+    'address': 'address',
+    'website': 'website',
+    'rating': 'rating',
+    'category': 'category',
+    'reviews': 'reviews_count',
+}
+_RE_PLACEHOLDER = re.compile(r'\{(' + '|'.join(TEMPLATE_PLACEHOLDERS) + r')\}')
+
+# Sentinel for "key not present" in safe_get_nested (None can be a real value)
+_MISSING = object()
+
+# Column headers for business CSV exports
+CSV_HEADERS = (
+    'Place ID', 'Name', 'Address', 'Phone', 'Website',
+    'Rating', 'Reviews', 'Category', 'Hours', 'Is Claimed'
+)
+
+
+class _PhoneCharTable(dict):
+    """
+    str.translate table that keeps '+' and decimal digits and drops the rest.
+
+    Latin-1 is filled in up front, which covers practically every phone
+    number. Any other code point is decided in __missing__ without being
+    stored, so the table never grows. Unicode digits are kept, like the
+    previous [^\\d+] regex.
+    """
+
+    def __init__(self):
+        super().__init__(
+            (ordinal, self._keep(ordinal)) for ordinal in range(256)
+        )
+
+    @staticmethod
+    def _keep(ordinal: int) -> Optional[int]:
+        char = chr(ordinal)
+        return ordinal if char == '+' or char.isdecimal() else None
+
+    def __missing__(self, ordinal: int) -> Optional[int]:
+        return self._keep(ordinal)
+
+
+_PHONE_KEEP = _PhoneCharTable()
+
 
 def clean_phone_number(phone: str) -> Optional[str]:
     """
@@ -30,17 +92,12 @@ def clean_phone_number(phone: str) -> Optional[str]:
     if not phone:
         return None
     
-    # Remove common prefixes that aren't part of the number
-    prefixes_to_remove = ['Phone:', 'Tel:', 'Mobile:', 'Call:']
-    for prefix in prefixes_to_remove:
-        phone = phone.replace(prefix, '').strip()
-    
-    # Keep only digits and +
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    # Keep only digits and + (this also drops prefixes like "Phone:" / "Tel:")
+    cleaned = phone.translate(_PHONE_KEEP)
     
     # Validate length (should be 10-15 digits)
-    digits_only = re.sub(r'\D', '', cleaned)
-    if len(digits_only) < 10 or len(digits_only) > 15:
+    digit_count = len(cleaned) - cleaned.count('+')
+    if digit_count < 10 or digit_count > 15:
         return None
     
     return cleaned
@@ -88,7 +145,7 @@ def clean_website(url: str) -> Optional[str]:
     # Skip Google redirect URLs
     if 'google.com' in url and '/url?' in url:
         # Try to extract the actual URL
-        match = re.search(r'url=([^&]+)', url)
+        match = _RE_REDIRECT_URL.search(url)
         if match:
             url = match.group(1)
     
@@ -112,16 +169,13 @@ def parse_rating(rating_text: str) -> Optional[float]:
     if not rating_text:
         return None
     
-    try:
-        # Look for number pattern
-        match = re.search(r'(\d+\.?\d*)', rating_text)
-        if match:
-            rating = float(match.group(1))
-            # Validate rating is in expected range
-            if 0 <= rating <= 5:
-                return rating
-    except (ValueError, AttributeError):
-        pass
+    # Look for number pattern (the match is always a valid float literal)
+    match = _RE_NUMBER.search(rating_text)
+    if match:
+        rating = float(match.group(1))
+        # Validate rating is in expected range
+        if 0 <= rating <= 5:
+            return rating
     
     return None
 
@@ -136,17 +190,14 @@ def parse_reviews_count(reviews_text: str) -> Optional[int]:
     Returns:
         Reviews count as integer or None
     """
-    if not reviews_text:
+    if not reviews_text or not isinstance(reviews_text, str):
         return None
     
-    try:
-        # Remove commas and find number
-        text = reviews_text.replace(',', '')
-        match = re.search(r'(\d+)', text)
-        if match:
-            return int(match.group(1))
-    except (ValueError, AttributeError):
-        pass
+    # Remove commas and find number
+    text = reviews_text.replace(',', '')
+    match = _RE_INTEGER.search(text)
+    if match:
+        return int(match.group(1))
     
     return None
 
@@ -168,25 +219,18 @@ def extract_coordinates_from_url(url: str) -> Optional[Dict[str, float]]:
     if not url:
         return None
     
-    try:
-        # Pattern 1: @lat,lng,zoom
-        match = re.search(r'@(-?\d+\.?\d*),(-?\d+\.?\d*)', url)
-        if match:
-            return {
-                'latitude': float(match.group(1)),
-                'longitude': float(match.group(2))
-            }
-        
-        # Pattern 2: !3dlat!4dlng
-        match = re.search(r'!3d(-?\d+\.?\d*)!4d(-?\d+\.?\d*)', url)
-        if match:
-            return {
-                'latitude': float(match.group(1)),
-                'longitude': float(match.group(2))
-            }
-            
-    except (ValueError, AttributeError):
-        pass
+    # Pattern 1: @lat,lng,zoom / Pattern 2: !3dlat!4dlng
+    # (the groups always hold valid float literals, so float() can't fail)
+    match = _RE_COORDS.search(url)
+    if match:
+        if match.group('lat1') is not None:
+            lat, lng = match.group('lat1', 'lng1')
+        else:
+            lat, lng = match.group('lat2', 'lng2')
+        return {
+            'latitude': float(lat),
+            'longitude': float(lng)
+        }
     
     return None
 
@@ -223,6 +267,26 @@ def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
 
 
+def iter_chunks(seq: Sequence[Any], chunk_size: int) -> Iterator[Sequence[Any]]:
+    """
+    Lazily yield chunks of a sequence, one at a time.
+    
+    Prefer this over chunk_list when the chunks are consumed once (e.g. batch
+    processing): only one chunk is alive at a time instead of a full copy of
+    the list. Slices of a list still copy; pass a memoryview of a
+    bytes/bytearray/array buffer to get zero-copy chunks.
+    
+    Args:
+        seq: Sequence to chunk (list, tuple, str, memoryview, ...)
+        chunk_size: Size of each chunk
+        
+    Yields:
+        Consecutive slices of seq
+    """
+    for i in range(0, len(seq), chunk_size):
+        yield seq[i:i + chunk_size]
+
+
 def safe_get_nested(data: Dict, *keys, default=None) -> Any:
     """
     Safely get a nested value from a dictionary.
@@ -239,15 +303,74 @@ def safe_get_nested(data: Dict, *keys, default=None) -> Any:
         safe_get_nested({'a': {'b': 1}}, 'a', 'b') -> 1
         safe_get_nested({'a': {}}, 'a', 'b', 'c', default=0) -> 0
     """
+    # Plain dicts (the common case) are walked with .get(); shallow lookups
+    # skip the loop entirely. An unhashable key makes .get() raise TypeError,
+    # which means "not found" just like it does for indexing.
+    if len(keys) == 2 and type(data) is dict:
+        try:
+            inner = data.get(keys[0], _MISSING)
+            if type(inner) is dict:
+                return inner.get(keys[1], default)
+        except TypeError:
+            return default
+    
     current = data
     for key in keys:
         try:
-            current = current[key]
+            if type(current) is dict:
+                current = current.get(key, _MISSING)
+                if current is _MISSING:
+                    return default
+            else:
+                # Lists, tuples and other containers
+                current = current[key]
         except (KeyError, TypeError, IndexError):
             return default
     return current
 
 
+def as_text(value: Any) -> str:
+    """Render a template value, with None as an empty string."""
+    return '' if value is None else str(value)
+
+
+@lru_cache(maxsize=64)
+def template_placeholders(template: str) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Get (placeholder, token, data key) for each placeholder a template uses.
+    Bulk sends fill one template for every business, so this is parsed once.
+    """
+    return tuple(
+        (name, f'{{{name}}}', TEMPLATE_PLACEHOLDERS[name])
+        for name in dict.fromkeys(_RE_PLACEHOLDER.findall(template))
+    )
+
+
+def fill_template(template: str, data: Dict[str, Any], defaults: Mapping[str, str]) -> str:
+    """
+    Fill an outreach message template from a business/lead dict.
+    
+    Only the placeholders the template references are looked up. For
+    message-length templates a few str.replace calls beat a regex sub with
+    a Python callback per match.
+    
+    Args:
+        template: Message template with {placeholder} tokens
+        data: Business/lead data
+        defaults: Value per placeholder when the data lacks it; placeholders
+                  not listed here are left as-is
+        
+    Returns:
+        Filled message
+    """
+    get = data.get
+    message = template
+    for name, token, key in template_placeholders(template):
+        if name in defaults:
+            message = message.replace(token, as_text(get(key, defaults[name])))
+    return message
+
+
 def truncate_string(s: str, max_length: int = 100, suffix: str = "...") -> str:
     """
     Truncate a string to a maximum length.
@@ -281,13 +404,30 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '', filename)
+    sanitized = _RE_FILENAME_BAD.sub('', filename)
     # Replace spaces with underscores
     sanitized = sanitized.replace(' ', '_')
     # Limit length
     return sanitized[:100]
 
 
+def _csv_row(r: Dict[str, Any]) -> List[str]:
+    """Build one CSV row (in CSV_HEADERS order) from a business dict."""
+    get = r.get
+    return [
+        get('place_id', ''),
+        get('name', ''),
+        get('address', ''),
+        get('phone', ''),
+        get('website', ''),
+        str(get('rating', '')),
+        str(get('reviews_count', '')),
+        get('category', ''),
+        get('hours', ''),
+        'Yes' if get('is_claimed') else 'No'
+    ]
+
+
 def results_to_csv_rows(results: List[Dict[str, Any]]) -> List[List[str]]:
     """
     Convert business results to CSV rows.
@@ -298,29 +438,22 @@ def results_to_csv_rows(results: List[Dict[str, Any]]) -> List[List[str]]:
     Returns:
         List of rows (each row is a list of values)
     """
-    headers = [
-        'Place ID', 'Name', 'Address', 'Phone', 'Website',
-        'Rating', 'Reviews', 'Category', 'Hours', 'Is Claimed'
-    ]
-    
-    rows = [headers]
+    return [list(CSV_HEADERS)] + [_csv_row(r) for r in results]
+
+
+def results_to_csv_stream(results: Iterable[Dict[str, Any]], writer) -> None:
+    """
+    Write business results straight to a csv.writer.
     
-    for r in results:
-        row = [
-            r.get('place_id', ''),
-            r.get('name', ''),
-            r.get('address', ''),
-            r.get('phone', ''),
-            r.get('website', ''),
-            str(r.get('rating', '')),
-            str(r.get('reviews_count', '')),
-            r.get('category', ''),
-            r.get('hours', ''),
-            'Yes' if r.get('is_claimed') else 'No'
-        ]
-        rows.append(row)
+    Unlike results_to_csv_rows, rows are produced lazily, so large exports
+    never hold the full list of rows in memory.
     
-    return rows
+    Args:
+        results: Business dictionaries (any iterable, e.g. a generator)
+        writer: csv.writer (or anything with writerow/writerows)
+    """
+    writer.writerow(CSV_HEADERS)
+    writer.writerows(_csv_row(r) for r in results)
 
 
 def merge_business_data(
@@ -338,10 +471,11 @@ def merge_business_data(
         Merged dictionary
     """
     merged = existing.copy()
+    merged_get = merged.get  # Bound once; called for every key of new
     
     for key, value in new.items():
         # Only update if new value is non-empty and existing is empty
-        if value and not merged.get(key):
+        if value and not merged_get(key):
             merged[key] = value
     
     return merged
@@ -350,25 +484,28 @@ def merge_business_data(
 class Timer:
     """Context manager for timing code blocks"""
     
+    __slots__ = ('name', 'start_time', 'end_time', 'duration')
+    
     def __init__(self, name: str = "Operation"):
         self.name = name
+        # time.perf_counter() readings (monotonic, not wall-clock)
         self.start_time = None
         self.end_time = None
         self.duration = None
     
     def __enter__(self):
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = datetime.now()
-        self.duration = (self.end_time - self.start_time).total_seconds()
+        self.end_time = time.perf_counter()
+        self.duration = self.end_time - self.start_time
         logger.info(f"{self.name} completed in {self.duration:.2f} seconds")
     
     def elapsed(self) -> float:
         """Get elapsed time in seconds"""
-        if self.duration:
+        if self.duration is not None:
             return self.duration
-        if self.start_time:
-            return (datetime.now() - self.start_time).total_seconds()
+        if self.start_time is not None:
+            return time.perf_counter() - self.start_time
         return 0.0